@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Word-timestamp indexes from ElevenLabs character alignment.
+Turns the per-character `characters` / `character_start_times_seconds` /
+`character_end_times_seconds` arrays of a with-timestamps response into a
+compact binary word index per text, which a player can seek by binary search
+instead of parsing JSON. Words are found in one regex scan over the joined
+characters, never a Python loop per character. Dialogue turn boundaries are
+respected the same way parseAlignmentToWords does in
+generate-elevenlabs-content.ts.
+
+Index format (little-endian), <id>.words:
+    header   "<4sHHI": magic b"CLWI", version, reserved, word count n
+    starts   float32[n]  word start, seconds (non-decreasing)
+    ends     float32[n]  word end, seconds
+    offsets  uint32[n+1] byte offsets of each word in the text blob
+    turns    uint8[n]    1 where a word opens a new dialogue turn
+    blob     UTF-8 word text, concatenated
+
+Usage:
+    python scripts/tts/alignment.py build [csv] --alignment-dir DIR [--out-dir DIR]
+    python scripts/tts/alignment.py lookup INDEX SECONDS
+"""
+
+import argparse
+import json
+import os
+import re
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import NamedTuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import CACHE_DIR, PROJECT_ROOT, iter_csv_rows
+
+WORD_INDEX_DIR = os.path.join(CACHE_DIR, "word_index")
+
+MAGIC = b"CLWI"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+
+WORD_SPAN_RE = re.compile(r"\S+")
+
+
+class Word(NamedTuple):
+    text: str
+    start: float
+    end: float
+    turn_start: bool
+
+
+def is_dialogue(romanian: str) -> bool:
+    """Same rule as isDialogue in generate-elevenlabs-content.ts."""
+    trimmed = romanian.strip()
+    return trimmed.startswith("- ") and len(dialogue_turns(romanian)) >= 2
+
+
+def dialogue_turns(romanian: str) -> list[str]:
+    """Same split as parseDialogueTurns: the texts sent to the dialogue API, dashes removed."""
+    turns = (re.sub(r"^- ", "", turn).strip() for turn in re.split(r"\n- ", romanian.strip()))
+    return [turn for turn in turns if turn]
+
+
+def turn_boundaries(romanian: str) -> list[int]:
+    """Character offsets where the dialogue API's concatenated turns meet."""
+    if not is_dialogue(romanian):
+        return []
+    offsets, offset = [], 0
+    for turn in dialogue_turns(romanian)[:-1]:
+        offset += len(turn)
+        offsets.append(offset)
+    return offsets
+
+
+def _unwrap(alignment: dict) -> dict:
+    """Accept a whole with-timestamps response or just its alignment object."""
+    return alignment.get("alignment") or alignment.get("normalized_alignment") or alignment
+
+
+def segment(alignment: dict, boundaries: list[int] | None = None) -> list[Word]:
+    """Split character alignment into timed words at whitespace and turn boundaries."""
+    alignment = _unwrap(alignment)
+    chars = alignment.get("characters") or []
+    starts = alignment["character_start_times_seconds"] if chars else []
+    ends = alignment["character_end_times_seconds"] if chars else []
+
+    joined = "".join(chars)
+    # Alignment entries are normally single characters; if not, map string positions back
+    position_to_entry = None
+    if len(joined) != len(chars):
+        position_to_entry = array("I")
+        for entry, piece in enumerate(chars):
+            position_to_entry.extend([entry] * len(piece))
+
+    def timing(first: int, last: int) -> tuple[float, float]:
+        if position_to_entry is not None:
+            first, last = position_to_entry[first], position_to_entry[last]
+        return starts[first], ends[last]
+
+    boundaries = boundaries or []
+    words: list[Word] = []
+    previous_end = 0
+    for match in WORD_SPAN_RE.finditer(joined):
+        span_start, span_end = match.span()
+        # A newline in the gap before a word means the speaker changed
+        turn_start = bool(words) and "\n" in joined[previous_end:span_start]
+        # The dialogue API drops separators between turns, so a boundary can fall mid-span
+        cuts = boundaries[bisect_right(boundaries, span_start):bisect_left(boundaries, span_end)]
+        piece_start = span_start
+        for cut in cuts + [span_end]:
+            start, end = timing(piece_start, cut - 1)
+            words.append(Word(joined[piece_start:cut], start, end, turn_start))
+            piece_start = cut
+            turn_start = True
+        previous_end = span_end
+    return words
+
+
+def encode(words: list[Word]) -> bytes:
+    """Serialise words into the binary index format."""
+    starts = array("f", (w.start for w in words))
+    ends = array("f", (w.end for w in words))
+    blob = bytearray()
+    offsets = array("I", [0])
+    for word in words:
+        blob += word.text.encode("utf-8")
+        offsets.append(len(blob))
+    turns = array("B", (w.turn_start for w in words))
+    for arr in (starts, ends, offsets):
+        if sys.byteorder != "little":
+            arr.byteswap()
+    return (HEADER.pack(MAGIC, VERSION, 0, len(words)) + starts.tobytes() + ends.tobytes()
+            + offsets.tobytes() + turns.tobytes() + bytes(blob))
+
+
+def write_index(words: list[Word], path: str):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(encode(words))
+    os.replace(tmp_path, path)
+
+
+class WordIndex:
+    """Read-only view of one .words file; seeks by binary search over the start times."""
+
+    def __init__(self, data: bytes):
+        magic, version, _, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a word index (or an unsupported version)")
+        if sys.byteorder != "little":
+            raise ValueError("word indexes are little-endian")
+        view = memoryview(data)
+        pos = HEADER.size
+        self.starts = view[pos:pos + 4 * count].cast("f")
+        pos += 4 * count
+        self.ends = view[pos:pos + 4 * count].cast("f")
+        pos += 4 * count
+        self.offsets = view[pos:pos + 4 * (count + 1)].cast("I")
+        pos += 4 * (count + 1)
+        self.turns = view[pos:pos + count]
+        self.blob = view[pos + count:]
+
+    @classmethod
+    def load(cls, path: str) -> "WordIndex":
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def word(self, i: int) -> Word:
+        text = bytes(self.blob[self.offsets[i]:self.offsets[i + 1]]).decode("utf-8")
+        return Word(text, self.starts[i], self.ends[i], bool(self.turns[i]))
+
+    def index_at(self, seconds: float) -> int | None:
+        """Index of the last word starting at or before ``seconds`` (None before the first)."""
+        i = bisect_right(self.starts, seconds) - 1
+        return i if i >= 0 else None
+
+
+def build(csv_path: str, alignment_dir: str, out_dir: str) -> tuple[int, int, int, int]:
+    """Index every CSV row that has <id>.json in alignment_dir; returns (texts, words, json, index bytes)."""
+    os.makedirs(out_dir, exist_ok=True)
+    texts = words = json_bytes = index_bytes = 0
+    for row in iter_csv_rows(csv_path):
+        source = os.path.join(alignment_dir, f"{row['id']}.json")
+        if not os.path.exists(source):
+            continue
+        with open(source, encoding="utf-8") as f:
+            alignment = json.load(f)
+        row_words = segment(alignment, turn_boundaries(row["text_romanian"]))
+        target = os.path.join(out_dir, f"{row['id']}.words")
+        write_index(row_words, target)
+        texts += 1
+        words += len(row_words)
+        json_bytes += os.path.getsize(source)
+        index_bytes += os.path.getsize(target)
+    return texts, words, json_bytes, index_bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query binary word-timestamp indexes.")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = sub.add_parser("build", help="Index <id>.json alignment files for the CSV rows")
+    build_parser.add_argument("csv", nargs="?", default=os.path.join(PROJECT_ROOT, "romanian_month1_124k.csv"))
+    build_parser.add_argument("--alignment-dir", required=True,
+                              help="Directory of <id>.json with-timestamps responses (or their alignment objects)")
+    build_parser.add_argument("--out-dir", default=WORD_INDEX_DIR, help="Where to write <id>.words")
+
+    lookup_parser = sub.add_parser("lookup", help="Show the word playing at a time")
+    lookup_parser.add_argument("index")
+    lookup_parser.add_argument("seconds", type=float)
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        texts, words, json_bytes, index_bytes = build(args.csv, args.alignment_dir, args.out_dir)
+        if not texts:
+            sys.exit(f"No alignment files in {args.alignment_dir} match the CSV ids")
+        print(f"Indexed {texts} texts, {words:,} words: {index_bytes:,} bytes "
+              f"(alignment JSON was {json_bytes:,})")
+        print(f"Word indexes written to: {args.out_dir}")
+        return
+
+    index = WordIndex.load(args.index)
+    i = index.index_at(args.seconds)
+    if i is None:
+        print(f"{args.seconds:.2f}s is before the first word")
+        return
+    word = index.word(i)
+    print(f"#{i} {word.text!r} {word.start:.3f}-{word.end:.3f}s" + (" (new turn)" if word.turn_start else ""))
+
+
+if __name__ == "__main__":
+    main()
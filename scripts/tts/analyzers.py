@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Pluggable per-text analyzers for richer corpus metrics.
+An analyzer is a function of text_romanian registered under a name and a
+version. Analysis runs the selected analyzers over streamed rows through a
+process pool with chunked dispatch and caches each value per text hash and
+analyzer version in .tts_cache/analysis.json, so adding or bumping one
+analyzer recomputes only that analyzer. Values are written to a side CSV
+keyed by id, leaving the main CSV's columns untouched.
+"""
+
+import csv
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, NamedTuple
+
+from chunking import segments
+from corpus import CACHE_DIR
+from tokenizer import normalize, tokenize
+
+ANALYSIS_CACHE_PATH = os.path.join(CACHE_DIR, "analysis.json")
+CACHE_VERSION = 1
+
+# Rows buffered per dispatch window, and the smallest window worth a process pool
+WINDOW_ROWS = 4096
+MIN_PARALLEL = 256
+
+# Comma-below and legacy cedilla forms, both cases
+DIACRITICS = set("ăâîșțşţĂÂÎȘȚŞŢ")
+
+# Function words; everything else counts as a content word for lexical density
+FUNCTION_WORDS = {
+    "a", "ai", "al", "ale", "am", "ar", "are", "aș", "au", "ca", "că", "cu",
+    "cum", "care", "ce", "cel", "cea", "cei", "cele", "da", "dacă", "dar",
+    "de", "deci", "din", "după", "e", "ea", "ei", "el", "ele", "este", "eu",
+    "fi", "fost", "îi", "îl", "îmi", "în", "într", "între", "își", "îți",
+    "la", "le", "lor", "lui", "m", "mă", "mai", "mea", "mei", "meu", "mi",
+    "mele", "ne", "nici", "noi", "nu", "o", "ori", "pe", "pentru", "prin",
+    "s", "sa", "să", "sau", "se", "sub", "sunt", "și", "te", "tu", "un",
+    "una", "unei", "unui", "vă", "voi", "vom", "va", "fără", "până", "spre",
+    "lângă", "despre", "foarte", "atunci", "acum", "aici", "acolo",
+}
+
+# LIX counts words longer than this as long words
+LIX_LONG_WORD = 6
+
+
+class Analyzer(NamedTuple):
+    name: str
+    version: int
+    func: Callable[[str], float]
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}@{self.version}"
+
+
+ANALYZERS: dict[str, Analyzer] = {}
+
+
+def analyzer(name: str, version: int = 1):
+    """Register a function of text_romanian as an analyzer; bump version when its output changes."""
+    def register(func: Callable[[str], float]) -> Callable[[str], float]:
+        ANALYZERS[name] = Analyzer(name, version, func)
+        return func
+    return register
+
+
+def _words(romanian: str) -> list[str]:
+    return [normalize(word) for word in tokenize(romanian)]
+
+
+@analyzer("sentence_count")
+def sentence_count(romanian: str) -> float:
+    """Sentences, with each dialogue turn counting as one."""
+    return len(segments(romanian))
+
+
+@analyzer("mean_sentence_length", version=2)
+def mean_sentence_length(romanian: str) -> float:
+    """Words per sentence."""
+    return len(_words(romanian)) / max(len(segments(romanian)), 1)
+
+
+@analyzer("lexical_density", version=2)
+def lexical_density(romanian: str) -> float:
+    """Share of words that are content words rather than function words."""
+    words = _words(romanian)
+    if not words:
+        return 0.0
+    return sum(1 for w in words if w not in FUNCTION_WORDS) / len(words)
+
+
+@analyzer("diacritic_ratio")
+def diacritic_ratio(romanian: str) -> float:
+    """Share of letters carrying a Romanian diacritic."""
+    letters = [c for c in romanian if c.isalpha()]
+    if not letters:
+        return 0.0
+    return sum(1 for c in letters if c in DIACRITICS) / len(letters)
+
+
+@analyzer("readability", version=2)
+def readability(romanian: str) -> float:
+    """LIX score: words per sentence plus the percentage of long words (language-independent)."""
+    words = _words(romanian)
+    if not words:
+        return 0.0
+    long_words = sum(1 for w in words if len(w) > LIX_LONG_WORD)
+    return len(words) / max(len(segments(romanian)), 1) + 100 * long_words / len(words)
+
+
+def parse_analyzers(spec: str) -> list[str]:
+    """Parse "all" or "a,b" into registered analyzer names."""
+    if spec.strip().lower() == "all":
+        return list(ANALYZERS)
+    names = [n.strip() for n in spec.split(",") if n.strip()]
+    unknown = [n for n in names if n not in ANALYZERS]
+    if unknown:
+        raise ValueError(f"Unknown analyzer(s): {', '.join(unknown)} (choose from {', '.join(ANALYZERS)})")
+    return names
+
+
+def content_hash(romanian: str) -> str:
+    """Analyzers only see the text, so its hash alone keys the cache."""
+    return hashlib.sha256(romanian.encode("utf-8")).hexdigest()[:16]
+
+
+def _analyze(job: tuple[str, tuple[str, ...]]) -> dict[str, float]:
+    """Pool worker: run the named analyzers over one text."""
+    romanian, names = job
+    return {ANALYZERS[name].key: round(ANALYZERS[name].func(romanian), 4) for name in names}
+
+
+class Analysis:
+    """Runs analyzers over rows as they stream past, writing values to a side CSV."""
+
+    def __init__(self, names: list[str], metrics_path: str, workers: int | None = None,
+                 cache_path: str = ANALYSIS_CACHE_PATH):
+        self.analyzers = [ANALYZERS[name] for name in names]
+        self.metrics_path = metrics_path
+        self.workers = workers or os.cpu_count() or 1
+        self.cache_path = cache_path
+        self.cache = self._load_cache()
+        self.computed = 0
+        self.cached = 0
+        self.seen: set[str] = set()
+
+    def _load_cache(self) -> dict[str, dict[str, float]]:
+        if not os.path.exists(self.cache_path):
+            return {}
+        with open(self.cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CACHE_VERSION:
+            return {}
+        return data.get("texts", {})
+
+    def _save_cache(self):
+        """Save the values of texts seen this run; edited and deleted texts drop out."""
+        current = {a.key for a in ANALYZERS.values()}
+        texts = {digest: {key: value for key, value in self.cache[digest].items() if key in current}
+                 for digest in self.seen}
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "texts": texts}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def _fill(self, window: list[dict], pool_holder: list):
+        """Compute every analyzer value the cache lacks for a window of rows."""
+        jobs, hashes = [], []
+        for row in window:
+            digest = content_hash(row["text_romanian"])
+            self.seen.add(digest)
+            entry = self.cache.setdefault(digest, {})
+            missing = tuple(a.name for a in self.analyzers if a.key not in entry)
+            if missing:
+                jobs.append((row["text_romanian"], missing))
+                hashes.append(digest)
+            else:
+                self.cached += 1
+        if not jobs:
+            return
+
+        if self.workers > 1 and len(jobs) >= MIN_PARALLEL:
+            if not pool_holder:
+                pool_holder.append(ProcessPoolExecutor(self.workers))
+            chunksize = max(1, len(jobs) // (self.workers * 4))
+            results = pool_holder[0].map(_analyze, jobs, chunksize=chunksize)
+        else:
+            results = map(_analyze, jobs)
+        for digest, values in zip(hashes, results):
+            self.cache[digest].update(values)
+        self.computed += len(jobs)
+
+    def _write_window(self, writer: csv.writer, window: list[dict]):
+        for row in window:
+            entry = self.cache[content_hash(row["text_romanian"])]
+            writer.writerow([row["id"]] + [entry[a.key] for a in self.analyzers])
+
+    def tap(self, rows: Iterable[dict]) -> Iterator[dict]:
+        """Yield rows unchanged, analysing them a window at a time."""
+        tmp_path = self.metrics_path + ".tmp"
+        pool_holder: list[ProcessPoolExecutor] = []
+        try:
+            with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["id"] + [a.name for a in self.analyzers])
+                window = []
+                for row in rows:
+                    window.append(row)
+                    if len(window) >= WINDOW_ROWS:
+                        self._fill(window, pool_holder)
+                        self._write_window(writer, window)
+                        yield from window
+                        window = []
+                self._fill(window, pool_holder)
+                self._write_window(writer, window)
+                yield from window
+        finally:
+            for pool in pool_holder:
+                pool.shutdown()
+        os.replace(tmp_path, self.metrics_path)
+        self._save_cache()
+
+    def summary(self) -> str:
+        names = ", ".join(a.name for a in self.analyzers)
+        return f"Analyzers ({names}): {self.computed} texts computed, {self.cached} from cache"
@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for synthesised TTS audio.
+Each blob is named by a 12-hex hash of (text_romanian, voice_id, speed), the
+same naming scheme as content/text/, so identical requests never hit the
+paid TTS API twice. The directory is size-capped with LRU eviction.
+
+Usage:
+    python scripts/tts/audio_cache.py romanian_month1_124k.csv [--missing-out todo.csv]
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import sys
+from typing import Iterable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import CACHE_DIR, PROJECT_ROOT, iter_csv_rows
+
+AUDIO_CACHE_DIR = os.path.join(CACHE_DIR, "audio")
+DEFAULT_MAX_BYTES = 2 * 1024 ** 3  # 2 GiB
+
+
+def audio_key(text: str, voice_id: str, speed: float) -> str:
+    """Return the 12-hex content hash for one synthesis request."""
+    # Format speed so 0.9 and 0.90 (CSV round-trip) share a key
+    payload = json.dumps([text, voice_id, f"{float(speed):g}"], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def row_key(row: dict) -> str:
+    return audio_key(row["text_romanian"], row["voice_id"], row["speed"])
+
+
+class AudioCache:
+    """On-disk blob store; a blob's mtime is its last-use time for LRU eviction."""
+
+    def __init__(self, root: str = AUDIO_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 extension: str = "mp3"):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.extension = extension
+        self._total: int | None = None  # running size, computed on first put
+        os.makedirs(root, exist_ok=True)
+
+    def path_for(self, key: str) -> str:
+        return os.path.join(self.root, f"{key}.{self.extension}")
+
+    def contains(self, row: dict, touch: bool = False) -> bool:
+        """Whether a row's audio is cached; with ``touch``, a hit also counts as a use."""
+        path = self.path_for(row_key(row))
+        if not touch:
+            return os.path.exists(path)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def get(self, row: dict) -> bytes | None:
+        """Return cached audio for a row and mark it as recently used."""
+        path = self.path_for(row_key(row))
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return data
+
+    def put(self, row: dict, data: bytes) -> str:
+        """Store audio for a row, then evict old blobs if over the size cap."""
+        path = self.path_for(row_key(row))
+        if self._total is None:
+            self._total = self.size()
+        if os.path.exists(path):
+            self._total -= os.path.getsize(path)
+
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._total += len(data)
+
+        # Only rescan the directory once the running total crosses the cap
+        if self._total > self.max_bytes:
+            self.evict(keep=path)
+        return path
+
+    def _blobs(self) -> list[tuple[float, int, str]]:
+        """(mtime, size, path) for every finished blob, oldest first."""
+        blobs = []
+        suffix = "." + self.extension
+        with os.scandir(self.root) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(suffix):
+                    st = entry.stat()
+                    blobs.append((st.st_mtime, st.st_size, entry.path))
+        blobs.sort()
+        return blobs
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self._blobs())
+
+    def evict(self, keep: str | None = None) -> list[str]:
+        """Delete least-recently-used blobs until the cache fits in max_bytes."""
+        blobs = self._blobs()
+        total = sum(size for _, size, _ in blobs)
+        removed = []
+        for _, size, path in blobs:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            os.remove(path)
+            total -= size
+            removed.append(path)
+        self._total = total
+        return removed
+
+    def partition(self, rows: Iterable[dict], touch: bool = True) -> tuple[list[dict], list[dict]]:
+        """Split rows into (already cached, still needing synthesis).
+
+        Cached rows are marked as used, so eviction during the same run never picks
+        blobs the run is relying on; report-only callers pass ``touch=False``.
+        """
+        cached, missing = [], []
+        for row in rows:
+            (cached if self.contains(row, touch) else missing).append(row)
+        return cached, missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report which CSV rows already have cached audio.")
+    parser.add_argument("csv", nargs="?", default=os.path.join(PROJECT_ROOT, "romanian_month1_124k.csv"))
+    parser.add_argument("--cache-dir", default=AUDIO_CACHE_DIR)
+    parser.add_argument("--extension", default="mp3")
+    parser.add_argument("--max-mb", type=int, default=DEFAULT_MAX_BYTES // 1024 ** 2)
+    parser.add_argument("--missing-out", help="Write rows without cached audio to this CSV")
+    parser.add_argument("--evict", action="store_true", help="Trim the cache to --max-mb first")
+    args = parser.parse_args()
+
+    cache = AudioCache(args.cache_dir, args.max_mb * 1024 ** 2, args.extension)
+    if args.evict:
+        removed = cache.evict()
+        print(f"Evicted {len(removed)} blobs")
+
+    rows = list(iter_csv_rows(args.csv))
+    cached, missing = cache.partition(rows, touch=False)
+    missing_chars = sum(r["character_count"] for r in missing)
+
+    print(f"Cached:  {len(cached)} rows")
+    print(f"Missing: {len(missing)} rows ({missing_chars:,} chars to synthesise)")
+    print(f"Cache size: {cache.size() / 1024 ** 2:,.1f} MB of {args.max_mb:,} MB")
+
+    if args.missing_out and rows:
+        with open(args.missing_out, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0].keys()))
+            writer.writeheader()
+            writer.writerows(missing)
+        print(f"Missing rows written to: {args.missing_out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark harness for the TTS CSV pipeline at synthetic corpus sizes.
+Builds Romanian-like corpora (10^3-10^6 texts) by recombining sentences from
+the real level modules, with the same schema as the `texts` lists, then
+times process_texts, write_csv and print_stats and records peak traced
+memory per stage. Results are saved as JSON for comparison across versions.
+
+Usage:
+    python scripts/tts/bench.py --sizes 1000,10000,100000
+    python scripts/tts/bench.py --sizes 1000000 --no-memory
+    python scripts/tts/bench.py --compare .tts_cache/bench/old.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import re
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import CACHE_DIR, iter_texts
+from generate_csv import print_stats, process_texts, write_csv
+from profiling import git_revision
+
+BENCH_DIR = os.path.join(CACHE_DIR, "bench")
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+# Share of each level and its character range, matching the current corpus
+LEVEL_PROFILE = {
+    "A1": (0.30, 330, 480),
+    "A2": (0.32, 415, 540),
+    "B1": (0.22, 630, 815),
+    "B2": (0.11, 1020, 1220),
+    "C1": (0.05, 1500, 1810),
+}
+
+# Levels whose texts are sometimes dialogues ("- " turns)
+DIALOGUE_LEVELS = {"A1", "A2"}
+DIALOGUE_SHARE = 0.2
+
+SENTENCE_RE = re.compile(r"[^.!?\n]+[.!?]")
+
+STAGES = ["load", "process_texts", "write_csv", "print_stats"]
+
+
+class SyntheticCorpus:
+    """Generates texts from a per-level pool of real sentences and topics."""
+
+    def __init__(self, seed: int = 0):
+        self.random = random.Random(seed)
+        self.sentences: dict[str, list[str]] = {level: [] for level in LEVEL_PROFILE}
+        self.topics: dict[str, list[str]] = {level: [] for level in LEVEL_PROFILE}
+        for text in iter_texts():
+            level = text["level"]
+            self.sentences[level] += [s.strip(" -") for s in SENTENCE_RE.findall(text["text_romanian"])]
+            if text["topic"] not in self.topics[level]:
+                self.topics[level].append(text["topic"])
+        self.levels = list(LEVEL_PROFILE)
+        self.weights = [LEVEL_PROFILE[level][0] for level in self.levels]
+
+    def text(self, index: int) -> dict:
+        rnd = self.random
+        level = rnd.choices(self.levels, self.weights)[0]
+        _, low, high = LEVEL_PROFILE[level]
+        target = rnd.randint(low, high)
+        dialogue = level in DIALOGUE_LEVELS and rnd.random() < DIALOGUE_SHARE
+
+        parts, length = [], 0
+        pool = self.sentences[level]
+        while length < target:
+            sentence = rnd.choice(pool)
+            parts.append(f"- {sentence}" if dialogue else sentence)
+            length += len(sentence) + 2
+        body = ("\n" if dialogue else " ").join(parts)
+
+        return {
+            "id": f"{level}_{index:07d}",
+            "level": level,
+            "text_romanian": body,
+            "topic": rnd.choice(self.topics[level]),
+            "speaker_gender": "male" if rnd.random() < 0.35 else "female",
+        }
+
+    def generate(self, size: int) -> list[dict]:
+        return [self.text(i) for i in range(size)]
+
+
+def run_pipeline(size: int, seed: int, trace_memory: bool) -> dict:
+    """Run each stage once, returning per-stage wall time and (optionally) peak memory."""
+    results = {}
+    if trace_memory:
+        tracemalloc.start()
+
+    def stage(name: str, fn):
+        if trace_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        value = fn()
+        elapsed = time.perf_counter() - start
+        results[name] = {"wall_sec": round(elapsed, 4), "per_item_us": round(elapsed / size * 1e6, 2)}
+        if trace_memory:
+            results[name]["peak_kb"] = round((tracemalloc.get_traced_memory()[1] - base) / 1024, 1)
+        return value
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = SyntheticCorpus(seed)
+        texts = stage("load", lambda: corpus.generate(size))
+        rows = stage("process_texts", lambda: list(process_texts(texts)))
+        stats = stage("write_csv", lambda: write_csv(rows, os.path.join(tmp, "bench.csv")))
+        with contextlib.redirect_stdout(io.StringIO()):
+            stage("print_stats", lambda: print_stats(stats))
+
+    if trace_memory:
+        tracemalloc.stop()
+    return results
+
+
+def run(sizes: list[int], seed: int, trace_memory: bool) -> dict:
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "seed": seed,
+        },
+        "results": [],
+    }
+    for size in sizes:
+        # Time without tracemalloc, which slows allocation-heavy code several-fold
+        stages = run_pipeline(size, seed, trace_memory=False)
+        if trace_memory:
+            for name, values in run_pipeline(size, seed, trace_memory=True).items():
+                stages[name]["peak_kb"] = values["peak_kb"]
+        report["results"].append({"size": size, "stages": stages})
+        print_result(size, stages)
+    return report
+
+
+def print_result(size: int, stages: dict):
+    print(f"\n{size:,} texts")
+    for name in STAGES:
+        s = stages[name]
+        peak = f" | peak {s['peak_kb'] / 1024:8.1f} MB" if "peak_kb" in s else ""
+        print(f"  {name:<14} {s['wall_sec']:9.3f}s | {s['per_item_us']:8.2f} µs/text{peak}")
+
+
+def compare(current: dict, baseline_path: str):
+    """Print wall-time ratios against a previous results file (>1 means slower now)."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    previous = {r["size"]: r["stages"] for r in baseline["results"]}
+    print(f"\nCompared with {baseline['meta'].get('revision') or baseline_path}:")
+    for result in current["results"]:
+        old = previous.get(result["size"])
+        if not old:
+            continue
+        ratios = " | ".join(
+            f"{name} {result['stages'][name]['wall_sec'] / old[name]['wall_sec']:.2f}x"
+            for name in STAGES if old.get(name, {}).get("wall_sec"))
+        print(f"  {result['size']:>9,}: {ratios}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the TTS CSV pipeline on synthetic corpora.")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="Comma-separated corpus sizes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--output", help="Results JSON path (default: .tts_cache/bench/bench-<rev>-<time>.json)")
+    parser.add_argument("--compare", help="Previous results JSON to compare against")
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(",")]
+    report = run(sizes, args.seed, trace_memory=not args.no_memory)
+
+    output = args.output
+    if not output:
+        os.makedirs(BENCH_DIR, exist_ok=True)
+        name = f"bench-{report['meta']['revision'] or 'local'}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        output = os.path.join(BENCH_DIR, name)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to: {output}")
+
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Character-budget packer for monthly TTS batches.
+Picks the subset of texts that maximises level and topic coverage without
+exceeding a character cap (e.g. the 124k monthly quota), optionally with
+per-level character quotas. Everything not picked is reported as deferred
+to the next month.
+
+The solver is a lazy greedy over coverage gain per character (O(N log N)),
+followed by a swap-based repair pass that trades redundant picks for texts
+covering a still-missing (level, topic) pair.
+"""
+
+import csv
+import heapq
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Iterable, NamedTuple
+
+# Coverage weights: a new (level, topic) pair matters most, then a new topic
+# anywhere in the batch; extra texts on a covered pair have diminishing value
+PAIR_WEIGHT = 10.0
+TOPIC_WEIGHT = 5.0
+REPEAT_WEIGHT = 1.0
+
+# Bound the repair pass so it stays cheap on very large corpora
+MAX_REPAIR_ATTEMPTS = 1000
+
+
+class Candidate(NamedTuple):
+    id: str
+    level: str
+    topic: str
+    chars: int
+    order: int
+
+
+@dataclass
+class PackResult:
+    cap: int
+    quotas: dict[str, int]
+    selected: set[str] = field(default_factory=set)
+    deferred: list[Candidate] = field(default_factory=list)
+    used: int = 0
+    used_by_level: Counter = field(default_factory=Counter)
+    pairs_covered: int = 0
+    pairs_total: int = 0
+
+    def summary(self) -> str:
+        lines = [
+            f"Budget: {self.used:,} / {self.cap:,} chars used ({self.used / self.cap * 100:.1f}%)",
+            f"Selected {len(self.selected)} texts, deferred {len(self.deferred)}",
+            f"Level/topic pairs covered: {self.pairs_covered} / {self.pairs_total}",
+        ]
+        for level in sorted(set(self.used_by_level) | set(self.quotas)):
+            quota = self.quotas.get(level)
+            limit = f" / {quota:,}" if quota is not None else ""
+            lines.append(f"  {level}: {self.used_by_level[level]:>7,}{limit} chars")
+        return "\n".join(lines)
+
+
+def candidate_from_text(text: dict, order: int) -> Candidate:
+    return Candidate(text["id"], text["level"], text["topic"], len(text["text_romanian"]), order)
+
+
+def parse_quotas(spec: str | None, cap: int) -> dict[str, int]:
+    """Parse "A1=0.3,B1=20000" into per-level char limits; values <= 1 are fractions of cap."""
+    quotas = {}
+    if not spec:
+        return quotas
+    for part in spec.split(","):
+        level, _, value = part.partition("=")
+        level = level.strip().upper()
+        if not value:
+            raise ValueError(f"Invalid quota '{part}', expected LEVEL=VALUE")
+        amount = float(value)
+        quotas[level] = int(amount * cap) if amount <= 1 else int(amount)
+    return quotas
+
+
+class _Coverage:
+    """Running coverage counts for the current selection."""
+
+    def __init__(self):
+        self.pairs = Counter()
+        self.topics = Counter()
+
+    def gain(self, c: Candidate) -> float:
+        pair_count = self.pairs[(c.level, c.topic)]
+        value = REPEAT_WEIGHT / (1 + pair_count)
+        if pair_count == 0:
+            value += PAIR_WEIGHT
+        if self.topics[c.topic] == 0:
+            value += TOPIC_WEIGHT
+        return value
+
+    def add(self, c: Candidate):
+        self.pairs[(c.level, c.topic)] += 1
+        self.topics[c.topic] += 1
+
+    def remove(self, c: Candidate):
+        self.pairs[(c.level, c.topic)] -= 1
+        self.topics[c.topic] -= 1
+
+
+def pack(candidates: Iterable[Candidate], cap: int, quotas: dict[str, int] | None = None) -> PackResult:
+    """Select texts under the character cap, maximising coverage gain per character."""
+    quotas = quotas or {}
+    result = PackResult(cap=cap, quotas=quotas)
+    coverage = _Coverage()
+    pool = list(candidates)
+    result.pairs_total = len({(c.level, c.topic) for c in pool})
+
+    def fits(c: Candidate, freed: int = 0, freed_level: int = 0) -> bool:
+        if result.used - freed + c.chars > cap:
+            return False
+        quota = quotas.get(c.level)
+        return quota is None or result.used_by_level[c.level] - freed_level + c.chars <= quota
+
+    # Lazy greedy: gains only shrink as coverage grows, so a popped entry whose
+    # recomputed gain still beats the next best is the true best choice
+    heap = [(-coverage.gain(c) / max(c.chars, 1), c.order, c) for c in pool]
+    heapq.heapify(heap)
+    chosen: dict[str, Candidate] = {}
+    skipped: list[Candidate] = []
+    while heap:
+        _, order, c = heapq.heappop(heap)
+        ratio = coverage.gain(c) / max(c.chars, 1)
+        if heap and ratio < -heap[0][0]:
+            heapq.heappush(heap, (-ratio, order, c))
+            continue
+        if not fits(c):
+            skipped.append(c)
+            continue
+        chosen[c.id] = c
+        coverage.add(c)
+        result.used += c.chars
+        result.used_by_level[c.level] += c.chars
+
+    _repair(chosen, skipped, coverage, result, fits)
+
+    result.selected = set(chosen)
+    result.deferred = sorted((c for c in pool if c.id not in chosen), key=lambda c: c.order)
+    result.pairs_covered = sum(1 for n in coverage.pairs.values() if n > 0)
+    return result
+
+
+def _repair(chosen: dict[str, Candidate], skipped: list[Candidate], coverage: _Coverage,
+            result: PackResult, fits) -> None:
+    """Swap a redundant pick for a skipped text that covers an uncovered pair."""
+    attempts = 0
+    for c in sorted(skipped, key=lambda c: c.chars):
+        if attempts >= MAX_REPAIR_ATTEMPTS:
+            break
+        if coverage.pairs[(c.level, c.topic)] > 0:
+            continue
+        attempts += 1
+        # Smallest same-level pick whose pair stays covered without it and frees enough room
+        victims = [v for v in chosen.values()
+                   if v.level == c.level and coverage.pairs[(v.level, v.topic)] > 1
+                   and fits(c, freed=v.chars, freed_level=v.chars)]
+        if not victims:
+            continue
+        victim = min(victims, key=lambda v: v.chars)
+        del chosen[victim.id]
+        coverage.remove(victim)
+        result.used -= victim.chars
+        result.used_by_level[victim.level] -= victim.chars
+
+        chosen[c.id] = c
+        coverage.add(c)
+        result.used += c.chars
+        result.used_by_level[c.level] += c.chars
+
+    # Top up any slack left behind by swaps
+    for c in sorted(skipped, key=lambda c: c.chars):
+        if c.id not in chosen and fits(c):
+            chosen[c.id] = c
+            coverage.add(c)
+            result.used += c.chars
+            result.used_by_level[c.level] += c.chars
+
+
+def write_deferred_report(result: PackResult, path: str):
+    """Write the texts deferred to the next month as CSV."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["id", "level", "topic", "character_count"])
+        for c in result.deferred:
+            writer.writerow([c.id, c.level, c.topic, c.chars])
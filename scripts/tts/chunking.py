@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Sentence-level chunking of processed texts for parallel synthesis.
+Splits text_romanian at sentence ends and dialogue turns ("\\n- ") into
+chunks of at most max_chars. Each chunk keeps its parent id, index and
+character offset, so chunks can be synthesised in parallel and stitched
+back together in order. Long C1 texts stop being the slowest request and
+the costliest retry.
+"""
+
+import csv
+import os
+import re
+from typing import Iterable, Iterator
+
+from tokenizer import word_count
+
+DEFAULT_MAX_CHARS = 400
+
+CHUNK_FIELDNAMES = [
+    "id", "parent_id", "chunk_index", "chunk_count", "offset", "level",
+    "text_romanian", "topic", "word_count", "character_count",
+    "speaker_gender", "voice_id", "speed", "estimated_duration_sec"
+]
+
+# A segment runs to a sentence end (plus closing quotes) or to the end of a dialogue line
+SEGMENT_RE = re.compile(r"[^\n]*?(?:[.!?…]+['\"”»)]*(?=\s|$)|(?=\n)|$)")
+
+# Clause punctuation preferred as a fallback break inside an over-long sentence
+CLAUSE_MARKS = ",;:"
+
+
+def segments(romanian: str) -> list[tuple[int, int]]:
+    """(start, end) spans of sentences and dialogue turns, whitespace trimmed."""
+    spans = []
+    for match in SEGMENT_RE.finditer(romanian):
+        start, end = match.span()
+        while start < end and romanian[start].isspace():
+            start += 1
+        while end > start and romanian[end - 1].isspace():
+            end -= 1
+        if start < end:
+            spans.append((start, end))
+    return spans
+
+
+def _split_long(romanian: str, start: int, end: int, max_chars: int) -> list[tuple[int, int]]:
+    """Break one span longer than max_chars at the last clause mark, else the last space, that fits."""
+    pieces = []
+    while end - start > max_chars:
+        window = romanian[start:start + max_chars + 1]
+        clause = max(window.rfind(mark + " ") for mark in CLAUSE_MARKS)
+        if clause > 0:
+            cut = clause + 1
+        else:
+            space = window.rfind(" ")
+            cut = space if space > 0 else max_chars
+        pieces.append((start, start + len(window[:cut].rstrip())))
+        start += cut
+        while start < end and romanian[start].isspace():
+            start += 1
+    if start < end:
+        pieces.append((start, end))
+    return pieces
+
+
+def chunk_spans(romanian: str, max_chars: int = DEFAULT_MAX_CHARS) -> list[tuple[int, int]]:
+    """Greedily pack consecutive segments into spans of at most max_chars."""
+    spans = []
+    current = None
+    for start, end in segments(romanian):
+        if end - start > max_chars:
+            if current:
+                spans.append(current)
+                current = None
+            spans.extend(_split_long(romanian, start, end, max_chars))
+            continue
+        if current and end - current[0] <= max_chars:
+            current = (current[0], end)
+        else:
+            if current:
+                spans.append(current)
+            current = (start, end)
+    if current:
+        spans.append(current)
+    return spans
+
+
+def chunk_text(row: dict, max_chars: int = DEFAULT_MAX_CHARS) -> list[dict]:
+    """Split one processed row into chunk rows; duration is shared out by character count."""
+    romanian = row["text_romanian"]
+    spans = chunk_spans(romanian, max_chars)
+    total_chars = sum(end - start for start, end in spans) or 1
+    chunks = []
+    for index, (start, end) in enumerate(spans):
+        piece = romanian[start:end]
+        chunks.append({
+            "id": f"{row['id']}.{index:03d}",
+            "parent_id": row["id"],
+            "chunk_index": index,
+            "chunk_count": len(spans),
+            "offset": start,
+            "level": row["level"],
+            "text_romanian": piece,
+            "topic": row["topic"],
+            "word_count": word_count(piece),
+            "character_count": len(piece),
+            "speaker_gender": row["speaker_gender"],
+            "voice_id": row["voice_id"],
+            "speed": row["speed"],
+            "estimated_duration_sec": round(row["estimated_duration_sec"] * len(piece) / total_chars, 1),
+        })
+    return chunks
+
+
+class ChunkWriter:
+    """Writes chunk rows to a side CSV while processed rows stream past."""
+
+    def __init__(self, path: str, max_chars: int = DEFAULT_MAX_CHARS):
+        self.path = path
+        self.max_chars = max_chars
+        self.chunk_count = 0
+        self.split_count = 0
+
+    def tap(self, rows: Iterable[dict]) -> Iterator[dict]:
+        """Yield rows unchanged, writing their chunks as a side effect."""
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=CHUNK_FIELDNAMES)
+            writer.writeheader()
+            for row in rows:
+                chunks = chunk_text(row, self.max_chars)
+                writer.writerows(chunks)
+                self.chunk_count += len(chunks)
+                self.split_count += len(chunks) > 1
+                yield row
+        os.replace(tmp_path, self.path)
+
+    def summary(self) -> str:
+        return (f"Chunks: {self.chunk_count} (≤{self.max_chars} chars), "
+                f"{self.split_count} texts split")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Compact columnar store behind StatsTable.
+Numeric metrics live in typed arrays and the low-cardinality columns
+(level, topic, speaker_gender, voice_id) are dictionary-encoded, so a row
+costs a few bytes per column instead of a dict with ten string keys. Text
+bodies are not kept: rows stream through the pipeline as dicts and only
+their metrics are collected here.
+"""
+
+from array import array
+
+CATEGORICAL_COLUMNS = ["level", "topic", "speaker_gender", "voice_id"]
+
+# column -> array typecode
+NUMERIC_COLUMNS = {
+    "word_count": "I",
+    "character_count": "I",
+    "estimated_duration_sec": "d",
+}
+
+
+class Categorical:
+    """Dictionary-encoded string column: each distinct value is stored once."""
+
+    __slots__ = ("values", "codes", "_index")
+
+    def __init__(self):
+        self.values: list[str] = []
+        self.codes = array("H")
+        self._index: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append(self, value: str):
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        self.codes.append(code)
+
+    def group_indices(self) -> dict[str, array]:
+        """Bucket row indices by value in one pass over the codes."""
+        buckets = [array("I") for _ in self.values]
+        for i, code in enumerate(self.codes):
+            buckets[code].append(i)
+        return dict(zip(self.values, buckets))
+
+
+class CorpusTable:
+    """Parallel typed columns holding the metrics of processed rows."""
+
+    def __init__(self):
+        self.categoricals = {name: Categorical() for name in CATEGORICAL_COLUMNS}
+        self.numerics = {name: array(code) for name, code in NUMERIC_COLUMNS.items()}
+
+    def __len__(self) -> int:
+        return len(self.numerics["character_count"])
+
+    def append(self, row: dict):
+        for name, column in self.categoricals.items():
+            column.append(row[name])
+        for name, column in self.numerics.items():
+            column.append(row[name])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Streaming loader for the CEFR level text corpus.
+Yields text dicts one level module (or one JSONL shard file) at a time,
+so only a single source is resident in memory while the pipeline runs.
+"""
+
+import csv
+import glob
+import importlib
+import json
+import os
+import sys
+from typing import Iterable, Iterator
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.abspath(os.path.join(SCRIPT_DIR, "..", ".."))
+CACHE_DIR = os.path.join(PROJECT_ROOT, ".tts_cache")
+
+# Level modules in output order
+LEVEL_MODULES = ["a1_texts", "a2_texts", "b1_texts", "b2_c1_texts"]
+
+# Generated CSV columns read back as numbers
+INT_FIELDS = ["word_count", "character_count"]
+FLOAT_FIELDS = ["speed", "estimated_duration_sec"]
+
+if SCRIPT_DIR not in sys.path:
+    sys.path.insert(0, SCRIPT_DIR)
+
+
+def iter_module(name: str) -> Iterator[dict]:
+    """Yield texts from one level module, then drop it from the import cache."""
+    module = importlib.import_module(name)
+    try:
+        yield from module.texts
+    finally:
+        # Release the module's list so the next level starts from a clean slate
+        sys.modules.pop(name, None)
+        del module
+
+
+def iter_shard(path: str) -> Iterator[dict]:
+    """Yield texts from a JSON Lines shard file, one line at a time."""
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path}:{line_no}: invalid JSON ({e.msg})") from e
+
+
+def iter_texts(modules: Iterable[str] = LEVEL_MODULES, shard_dir: str | None = None) -> Iterator[dict]:
+    """Yield every text in corpus order: level modules first, then sorted shard files."""
+    for name in modules:
+        yield from iter_module(name)
+
+    if shard_dir:
+        for path in sorted(glob.glob(os.path.join(shard_dir, "*.jsonl"))):
+            yield from iter_shard(path)
+
+
+def iter_csv_rows(path: str) -> Iterator[dict]:
+    """Yield rows of a generated CSV with numeric columns converted back to numbers."""
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            for field in INT_FIELDS:
+                if field in row:
+                    row[field] = int(row[field])
+            for field in FLOAT_FIELDS:
+                if field in row:
+                    row[field] = float(row[field])
+            yield row
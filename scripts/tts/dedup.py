@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Near-duplicate detection across the CEFR level modules.
+Each text is reduced to a MinHash signature over word 3-gram shingles and
+indexed with LSH banding, so only texts sharing a band bucket are compared.
+That keeps detection sub-quadratic as the corpus grows, and lets
+generate_csv.py refuse to pay for the same text twice.
+
+Signatures use one-permutation hashing with rotation densification: every
+shingle is hashed once and binned, instead of once per permutation.
+
+Usage:
+    python scripts/tts/dedup.py [--threshold 0.8]
+"""
+
+import argparse
+import os
+import re
+import sys
+import zlib
+from itertools import combinations
+from typing import Iterable
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import snapshot
+
+NUM_PERM = 64
+BANDS = 16  # 16 bands x 4 rows: pairs above ~0.5 Jaccard become candidates
+SHINGLE_SIZE = 3
+DEFAULT_THRESHOLD = 0.8
+
+EMPTY = 1 << 64
+
+WORD_RE = re.compile(r"\w+")
+
+
+def shingles(romanian: str, size: int = SHINGLE_SIZE) -> set[str]:
+    """Word n-grams, ignoring case, punctuation and dialogue dashes."""
+    words = WORD_RE.findall(romanian.lower())
+    if len(words) < size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+class MinHashLSH:
+    """MinHash signatures bucketed by LSH bands."""
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = BANDS, seed: int = 0x9E3779B9):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.seed = seed
+        self.signatures: dict[str, tuple[int, ...]] = {}
+        self.buckets: list[dict[tuple, list[str]]] = [{} for _ in range(bands)]
+
+    def signature(self, items: set[str]) -> tuple[int, ...]:
+        """One-permutation MinHash: the low bits pick a bin, the rest compete for its minimum."""
+        k = self.num_perm
+        crc32, seed = zlib.crc32, self.seed
+        sig = [EMPTY] * k
+        for item in items:
+            # Two differently seeded CRC32s make a cheap, deterministic 64-bit hash
+            data = item.encode("utf-8")
+            value, bin_index = divmod((crc32(data) << 32) | crc32(data, seed), k)
+            if value < sig[bin_index]:
+                sig[bin_index] = value
+        # Densify: an empty bin borrows from the next filled bin to its right,
+        # offset by the distance so borrowed values stay distinguishable
+        if EMPTY in sig and any(v != EMPTY for v in sig):
+            for i in range(k):
+                if sig[i] != EMPTY:
+                    continue
+                distance = 1
+                while sig[(i + distance) % k] == EMPTY:
+                    distance += 1
+                sig[i] = (sig[(i + distance) % k] + distance * EMPTY)
+        return tuple(sig)
+
+    def add(self, key: str, romanian: str):
+        sig = self.signature(shingles(romanian))
+        self.signatures[key] = sig
+        for band in range(self.bands):
+            chunk = sig[band * self.rows:(band + 1) * self.rows]
+            self.buckets[band].setdefault(chunk, []).append(key)
+
+    def similarity(self, a: str, b: str) -> float:
+        """Estimated Jaccard similarity from the signatures."""
+        sa, sb = self.signatures[a], self.signatures[b]
+        return sum(1 for x, y in zip(sa, sb) if x == y) / self.num_perm
+
+    def candidate_pairs(self) -> set[tuple[str, str]]:
+        pairs = set()
+        for buckets in self.buckets:
+            for keys in buckets.values():
+                if len(keys) > 1:
+                    pairs.update(combinations(sorted(keys), 2))
+        return pairs
+
+    def similar_pairs(self, threshold: float = DEFAULT_THRESHOLD) -> list[tuple[str, str, float]]:
+        """Candidate pairs whose estimated similarity reaches threshold, most similar first."""
+        result = []
+        for a, b in self.candidate_pairs():
+            sim = self.similarity(a, b)
+            if sim >= threshold:
+                result.append((a, b, sim))
+        result.sort(key=lambda p: (-p[2], p[0], p[1]))
+        return result
+
+
+def find_duplicates(texts: Iterable[dict], threshold: float = DEFAULT_THRESHOLD) -> list[tuple[str, str, float]]:
+    """Build an index over the texts and return near-duplicate id pairs."""
+    index = MinHashLSH()
+    for text in texts:
+        index.add(text["id"], text["text_romanian"])
+    return index.similar_pairs(threshold)
+
+
+def print_duplicates(pairs: list[tuple[str, str, float]]):
+    for a, b, sim in pairs:
+        print(f"  {a} ~ {b}  ({sim:.0%} similar)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report near-duplicate texts across the level modules.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Minimum estimated Jaccard similarity to report")
+    parser.add_argument("--shard-dir", help="Also index *.jsonl shards in this directory")
+    args = parser.parse_args()
+
+    pairs = find_duplicates(snapshot.iter_texts(shard_dir=args.shard_dir), args.threshold)
+    if not pairs:
+        print(f"No near-duplicates at ≥{args.threshold:.0%} similarity")
+        return
+    print(f"{len(pairs)} near-duplicate pairs at ≥{args.threshold:.0%} similarity:")
+    print_duplicates(pairs)
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
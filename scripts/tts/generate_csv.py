@@ -4,143 +4,436 @@ Generate romanian_month1_124k.csv from individual CEFR level text files.
 Combines all texts, assigns voices, calculates metrics, and outputs CSV.
 """
 
-import csv
+import argparse
+import contextlib
 import os
 import sys
+from typing import Callable, Iterable, Iterator
 
 # Add current directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from a1_texts import texts as a1_texts
-from a2_texts import texts as a2_texts
-from b1_texts import texts as b1_texts
-from b2_c1_texts import texts as b2_c1_texts
-
-# Voice IDs
-MALE_VOICES = [
-    "b4bnZ9y3ZRH0myLzE2B5",
-    "8nBBDfYxYXmDNaqTCxPH",
-    "HPdbgrGubKiBta6Pq21b",
-]
-
-FEMALE_VOICES = [
-    "PoHUWWWMHFrA8z7Q88pu",
-    "QtObtrglHRaER8xlDZsr",
-    "gbLy9ep70G3JW53cTzFC",
-    "gCte8DU5EgI3W1KcuLSA",
-    "kZXTQfulCLOSFsxuZQHx",
-    "GRHbHyXbUO8nF4YexVTa",
-]
+import corpus
+import snapshot
+from analyzers import Analysis, parse_analyzers
+from budget import candidate_from_text, pack, parse_quotas, write_deferred_report
+from chunking import ChunkWriter
+from corpus import PROJECT_ROOT
+from dedup import DEFAULT_THRESHOLD, find_duplicates, print_duplicates
+from ledger import LEDGER_PATH, Ledger
+from manifest import IncrementalState
+from normalize import Normalizer
+from outputs import FIELDNAMES, CsvOutput, OutputWriter, open_outputs, parse_formats
+from profiling import Profiler, print_report, write_report
+from ratemodel import RATE_MODEL_PATH, RateModel
+from shards import DEFAULT_SHARD_ROWS, SHARD_BY, ShardedCsvOutput
+from stats import StatsTable
+from tokenizer import TOKENIZER_VERSION, word_count
+from validate import print_problems, source_texts, validate
+from voices import BalancedScheduler, RoundRobinScheduler, VoiceCapacityError, parse_capacities
+from watch import DEFAULT_INTERVAL, Watcher
 
 SPEED = 0.90
 
+# The plain run's CSV is the one generate-elevenlabs-content.ts reads; ledger months
+# (--month N) get their own files so they never overwrite it or each other
+OUTPUT_NAME = "romanian_month1_124k.csv"
+MONTH_OUTPUT_NAME = "romanian_batch{month}_124k.csv"
+
 # Romanian TTS: ~135 wpm at 0.90 speed, avg word ~5.5 chars
 # chars_per_second = (135 * 5.5) / 60 ≈ 12.4
 # At 0.90 speed, duration is longer: chars_per_sec_effective = 12.4 * 0.90 = 11.16
+# Fallback only: a fitted rate_model.json (see ratemodel.py) takes precedence
 CHARS_PER_SEC = 11.16
 
+# Columns process_text computes; a reused row contributes only these, the rest comes from the source
+COMPUTED_COLUMNS = ["character_count", "word_count", "speed", "voice_id", "estimated_duration_sec"]
 
-def assign_voice(gender: str, index: int) -> str:
-    """Assign a voice ID based on gender, cycling through available voices."""
-    if gender == "male":
-        return MALE_VOICES[index % len(MALE_VOICES)]
-    else:
-        return FEMALE_VOICES[index % len(FEMALE_VOICES)]
+def estimate_duration(text: dict, rate_model: RateModel | None = None) -> float:
+    """Seconds of audio for a processed text, from the fitted model when it covers the voice."""
+    if rate_model:
+        predicted = rate_model.predict(text["text_romanian"], text["voice_id"], text["speed"])
+        if predicted is not None:
+            return round(predicted, 1)
+    return round(text["character_count"] / CHARS_PER_SEC, 1)
+
+
+def process_texts(all_texts: Iterable[dict],
+                  reuse: Callable[[dict], dict | None] | None = None,
+                  rate_model: RateModel | None = None,
+                  scheduler: BalancedScheduler | RoundRobinScheduler | None = None,
+                  analysis: Analysis | None = None) -> Iterator[dict]:
+    """Calculate metrics and assign voices, yielding each text as it is processed.
+
+    If ``reuse`` returns a previous row for a text, its metrics and voice are
+    kept as-is instead of being recomputed. Voices come from ``scheduler``
+    (load-balanced by default). ``analysis`` runs extra per-text analyzers
+    over the stream in a process pool.
+    """
+    rows = _process_rows(all_texts, reuse, rate_model, scheduler)
+    return analysis.tap(rows) if analysis else rows
 
 
-def process_texts(all_texts: list[dict]) -> list[dict]:
-    """Calculate metrics and assign voices for all texts."""
-    male_idx = 0
-    female_idx = 0
+def _process_rows(all_texts: Iterable[dict],
+                  reuse: Callable[[dict], dict | None] | None,
+                  rate_model: RateModel | None,
+                  scheduler: BalancedScheduler | RoundRobinScheduler | None) -> Iterator[dict]:
+    if scheduler is None:
+        scheduler = BalancedScheduler()
 
     for text in all_texts:
-        romanian = text["text_romanian"]
-        text["character_count"] = len(romanian)
-        text["word_count"] = len(romanian.split())
-        text["speed"] = SPEED
-        text["estimated_duration_sec"] = round(text["character_count"] / CHARS_PER_SEC, 1)
+        cached = reuse(text) if reuse else None
+        if cached is not None:
+            text.update((column, cached[column]) for column in COMPUTED_COLUMNS)
+            text["speaker_gender"] = text.get("speaker_gender", "female")
+            # Keep the scheduler's voice loads in step with a full rebuild
+            scheduler.record(text, text["voice_id"])
+            yield text
+            continue
+
+        yield process_text(text, scheduler, rate_model)
+
+
+def process_text(text: dict, scheduler: BalancedScheduler | RoundRobinScheduler,
+                 rate_model: RateModel | None = None, voice_id: str | None = None) -> dict:
+    """Calculate one text's metrics and voice; a given ``voice_id`` is kept instead of scheduling one."""
+    romanian = text["text_romanian"]
+    text["character_count"] = len(romanian)
+    text["word_count"] = word_count(romanian)
+    text["speed"] = SPEED
+
+    text["speaker_gender"] = text.get("speaker_gender", "female")
+    text["voice_id"] = voice_id or scheduler.assign(text)
 
-        gender = text.get("speaker_gender", "female")
-        text["speaker_gender"] = gender
+    text["estimated_duration_sec"] = estimate_duration(text, rate_model)
 
-        if gender == "male":
-            text["voice_id"] = assign_voice("male", male_idx)
-            male_idx += 1
-        else:
-            text["voice_id"] = assign_voice("female", female_idx)
-            female_idx += 1
+    return text
 
-    return all_texts
 
+def write_outputs(all_texts: Iterable[dict], writers: list[OutputWriter]) -> StatsTable:
+    """Stream texts to every output writer, collecting their metrics into a StatsTable in the same pass.
 
-def write_csv(all_texts: list[dict], output_path: str):
-    """Write all texts to CSV."""
-    fieldnames = [
-        "id", "level", "text_romanian", "topic", "word_count",
-        "character_count", "speaker_gender", "voice_id", "speed",
-        "estimated_duration_sec"
-    ]
+    Each writer fills a temp file that is only swapped into place once the
+    stream completes, so an interrupted run never leaves a truncated output.
+    """
+    stats = StatsTable()
 
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(all_texts)
+    with contextlib.ExitStack() as stack:
+        for writer in writers:
+            stack.enter_context(writer)
+        for text in all_texts:
+            for writer in writers:
+                writer.write(text)
+            stats.append(text)
 
+    return stats
 
-def print_stats(all_texts: list[dict]):
+
+def write_csv(all_texts: Iterable[dict], output_path: str) -> StatsTable:
+    """Stream texts to CSV, collecting their metrics into a StatsTable in the same pass."""
+    return write_outputs(all_texts, [CsvOutput(output_path, FIELDNAMES)])
+
+
+def print_stats(stats: StatsTable):
     """Print summary statistics."""
-    total_chars = sum(t["character_count"] for t in all_texts)
-    total_words = sum(t["word_count"] for t in all_texts)
-    total_duration = sum(t["estimated_duration_sec"] for t in all_texts)
-    male_count = sum(1 for t in all_texts if t["speaker_gender"] == "male")
-    female_count = sum(1 for t in all_texts if t["speaker_gender"] == "female")
+    totals = stats.aggregate()
+    total_chars = totals["character_count"]["sum"]
+    total_words = totals["word_count"]["sum"]
+    total_duration = totals["estimated_duration_sec"]["sum"]
+    male_count = stats.count("gender", "male")
+    female_count = stats.count("gender", "female")
+    total = len(stats) or 1  # an empty run prints zero shares rather than dividing by zero
 
     print(f"\n{'='*60}")
     print(f"Romanian TTS Content Generation Summary")
     print(f"{'='*60}")
-    print(f"Total texts:      {len(all_texts)}")
+    print(f"Total texts:      {len(stats)}")
     print(f"Total characters: {total_chars:,}")
     print(f"Total words:      {total_words:,}")
     print(f"Total duration:   {total_duration:,.1f} sec ({total_duration/60:,.1f} min)")
-    print(f"Male speakers:    {male_count} ({male_count/len(all_texts)*100:.1f}%)")
-    print(f"Female speakers:  {female_count} ({female_count/len(all_texts)*100:.1f}%)")
+    print(f"Male speakers:    {male_count} ({male_count/total*100:.1f}%)")
+    print(f"Female speakers:  {female_count} ({female_count/total*100:.1f}%)")
     print()
 
-    for level in ["A1", "A2", "B1", "B2", "C1"]:
-        level_texts = [t for t in all_texts if t["level"] == level]
-        if not level_texts:
-            continue
-        level_chars = sum(t["character_count"] for t in level_texts)
-        level_duration = sum(t["estimated_duration_sec"] for t in level_texts)
-        avg_chars = level_chars / len(level_texts)
-        min_chars = min(t["character_count"] for t in level_texts)
-        max_chars = max(t["character_count"] for t in level_texts)
-        print(f"  {level}: {len(level_texts):3d} texts | {level_chars:>6,} chars | "
-              f"avg {avg_chars:>5.0f} | range {min_chars}-{max_chars} | "
+    for level in stats.group_keys("level"):
+        level_stats = stats.aggregate(stats.group_indices("level")[level])
+        chars = level_stats["character_count"]
+        level_duration = level_stats["estimated_duration_sec"]["sum"]
+        print(f"  {level}: {chars['count']:3d} texts | {chars['sum']:>6,} chars | "
+              f"avg {chars['mean']:>5.0f} | range {chars['min']}-{chars['max']} | "
+              f"p50 {chars['p50']:>5.0f} p90 {chars['p90']:>5.0f} | "
               f"{level_duration:>6.1f}s ({level_duration/60:.1f}min)")
 
     print(f"\n{'='*60}")
 
 
-def main():
-    # Combine all texts in order
-    all_texts = a1_texts + a2_texts + b1_texts + b2_c1_texts
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--shard-dir", help="Directory of extra *.jsonl text shards to stream after the level modules")
+    parser.add_argument("--no-snapshot", action="store_true",
+                        help="Import the level modules directly instead of the compiled corpus snapshot")
+    parser.add_argument("--no-normalize", action="store_true",
+                        help="Keep text_romanian as written instead of canonicalising diacritics (NFC, ș/ț comma-below)")
+    parser.add_argument("--no-rate-model", action="store_true",
+                        help=f"Estimate durations from CHARS_PER_SEC even if {os.path.basename(RATE_MODEL_PATH)} exists")
+    parser.add_argument("--voice-strategy", choices=["balanced", "round-robin"], default="balanced",
+                        help="Balance characters per voice, or cycle voices as before")
+    parser.add_argument("--voice-capacity", help='Per-voice char limits for balanced mode, e.g. "voiceA=20000"')
+    parser.add_argument("--full", action="store_true", help="Ignore the manifest and recompute every row")
+    parser.add_argument("--stats-json", help="Also write grouped statistics (level/topic/gender/voice) as JSON")
+    parser.add_argument("--no-validate", action="store_true",
+                        help="Skip the schema check (keys, levels, genders, unique ids, length bounds)")
+    parser.add_argument("--month", type=int,
+                        help="Monthly batch: only texts the run ledger has not produced in an earlier month")
+    parser.add_argument("--ledger", default=LEDGER_PATH, help="Run ledger database for --month")
+    parser.add_argument("--dedup", action="store_true",
+                        help="Pre-flight: abort if any near-duplicate texts are found")
+    parser.add_argument("--dedup-threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Similarity at which --dedup treats two texts as duplicates")
+    parser.add_argument("--formats", default="",
+                        help="Columnar formats to write alongside the CSV: parquet, arrow (needs pyarrow)")
+    parser.add_argument("--shard-by", choices=SHARD_BY,
+                        help="Also split rows into shard CSVs (by level, or every --shard-rows rows) with a manifest")
+    parser.add_argument("--shard-rows", type=int, default=DEFAULT_SHARD_ROWS,
+                        help=f"Rows per shard with --shard-by rows (default {DEFAULT_SHARD_ROWS:,})")
+    parser.add_argument("--analyze", metavar="NAMES",
+                        help='Run per-text analyzers ("all" or e.g. "readability,diacritic_ratio") into <csv>.metrics.csv')
+    parser.add_argument("--workers", type=int, help="Processes for --analyze (default: CPU count)")
+    parser.add_argument("--chunk-size", type=int,
+                        help="Also write <csv>.chunks.csv, splitting texts at sentences/turns into chunks of at most N chars")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time each stage (wall, CPU, tracemalloc peak, items) and write <csv>.run.json")
+    parser.add_argument("--cprofile", metavar="PATH", help="With profiling, also dump cProfile stats (.prof)")
+    parser.add_argument("--flamegraph", metavar="PATH",
+                        help="With profiling, also write sampled collapsed stacks for flamegraph.pl/speedscope")
+    parser.add_argument("--budget", type=int, help="Character cap; pick the best-covering subset that fits")
+    parser.add_argument("--quota", help='Per-level char limits for --budget, e.g. "A1=0.3,A2=0.3,C1=15000"')
+    parser.add_argument("--watch", action="store_true",
+                        help="After generating, keep running and update the CSV for just the texts edited in a level module")
+    parser.add_argument("--watch-interval", type=float, default=DEFAULT_INTERVAL,
+                        help="Seconds between checks of the level modules in --watch mode")
+    args = parser.parse_args(argv)
+    try:
+        parse_formats(args.formats)
+    except ValueError as e:
+        parser.error(f"--formats: {e}")
+    try:
+        parse_capacities(args.voice_capacity)
+    except ValueError as e:
+        parser.error(f"--voice-capacity: {e}")
+    if args.quota and not args.budget:
+        parser.error("--quota only applies with --budget")
+    if args.watch and (args.budget or args.month):
+        parser.error("--watch keeps the whole corpus current; it cannot be combined with --budget or --month")
+    return args
 
-    # Process: calculate metrics and assign voices
-    all_texts = process_texts(all_texts)
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+
+    profiler = Profiler(args.profile, args.cprofile, args.flamegraph)
+    profiler.start()
 
     # Output path - write to project root
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    project_root = os.path.abspath(os.path.join(script_dir, "..", ".."))
-    output_path = os.path.join(project_root, "romanian_month1_124k.csv")
+    output_name = MONTH_OUTPUT_NAME.format(month=args.month) if args.month else OUTPUT_NAME
+    output_path = os.path.join(PROJECT_ROOT, output_name)
+
+    # Fitted speech-rate model, if one has been calibrated
+    try:
+        rate_model = None if args.no_rate_model else RateModel.load()
+    except ValueError as e:  # stale features or a corrupt file
+        sys.exit(f"{e} (or run with --no-rate-model)")
+
+    if args.voice_strategy == "balanced":
+        scheduler = BalancedScheduler(parse_capacities(args.voice_capacity))
+    else:
+        scheduler = RoundRobinScheduler()
 
-    # Write CSV
-    write_csv(all_texts, output_path)
+    # Previous manifest + CSV rows, so unchanged texts skip recomputation;
+    # a different rate model, voice strategy or word counting invalidates every previous row
+    duration_settings = rate_model.fingerprint() if rate_model else f"chars_per_sec={CHARS_PER_SEC}"
+    settings = f"{duration_settings}|voices={scheduler.name}:{args.voice_capacity or ''}|words=tokenizer{TOKENIZER_VERSION}"
+    incremental = IncrementalState(output_path, full=args.full, settings=settings)
+
+    # Stream all texts in order, from the memory-mapped snapshot (rebuilt if a source changed)
+    # or one level module at a time
+    iter_texts = corpus.iter_texts if args.no_snapshot else snapshot.iter_texts
+
+    # Pre-flight: a schema problem found now costs nothing; found after synthesis, it costs audio
+    if not args.no_validate:
+        with profiler.stage("validate"):
+            try:
+                problems = validate(profiler.counted(
+                    "validate", source_texts(args.shard_dir, use_snapshot=not args.no_snapshot)))
+            except ValueError as e:  # a shard line that is not JSON
+                sys.exit(str(e))
+        if problems:
+            print(f"Found {len(problems)} schema problems:")
+            print_problems(problems)
+            sys.exit("Aborting before writing the CSV; fix the texts above")
+
+    # Pre-flight: refuse to pay twice for near-identical texts
+    if args.dedup:
+        with profiler.stage("dedup"):
+            pairs = find_duplicates(profiler.counted("dedup", iter_texts(shard_dir=args.shard_dir)),
+                                    args.dedup_threshold)
+        if pairs:
+            print(f"Found {len(pairs)} near-duplicate pairs at ≥{args.dedup_threshold:.0%} similarity:")
+            print_duplicates(pairs)
+            sys.exit("Aborting before writing the CSV; remove or rewrite the duplicates")
+
+    # Diacritic normalization: canonical text before any metric is calculated
+    normalizer = None if args.no_normalize else Normalizer()
+
+    # Monthly batch: anti-join the corpus against the ledger, hashing the text as it will be written
+    ledger, pending = None, None
+    if args.month:
+        ledger = Ledger(args.ledger)
+        texts = iter_texts(shard_dir=args.shard_dir)
+        with profiler.stage("ledger"):
+            pending = ledger.pending(Normalizer().tap(texts) if normalizer else texts, args.month)
+        profiler.count("ledger", len(pending))
+        if not pending:
+            print(ledger.summary(args.month))
+            print(f"Nothing new to produce for month {args.month}")
+            ledger.close()
+            return
+
+    def month_texts():
+        texts = iter_texts(shard_dir=args.shard_dir)
+        if pending is not None:
+            texts = (t for t in texts if t["id"] in pending)
+        return texts
+
+    # Budget mode: pack ids from a lightweight first pass, then stream again keeping only those
+    budget = None
+    if args.budget:
+        candidates = (candidate_from_text(t, i) for i, t in enumerate(month_texts()))
+        with profiler.stage("budget"):
+            budget = pack(candidates, args.budget, parse_quotas(args.quota, args.budget))
+        profiler.count("budget", len(budget.selected))
+        if not budget.selected:
+            print(budget.summary())
+            if ledger:
+                ledger.close()
+            sys.exit(f"No text fits in {args.budget:,} characters; {os.path.basename(output_path)} left unchanged")
+
+    def run_texts():
+        texts = month_texts()
+        if budget:
+            texts = (t for t in texts if t["id"] in budget.selected)
+        return texts
+
+    # Balanced voices: plan longest-first from a lightweight pass before streaming for real
+    if isinstance(scheduler, BalancedScheduler):
+        with profiler.stage("plan"):
+            texts = profiler.counted("plan", run_texts())
+            try:
+                # Reused rows keep their voices; plan around them so capacities still hold
+                scheduler.plan(Normalizer().tap(texts) if normalizer else texts, fixed=incremental.reusable_voice)
+            except VoiceCapacityError as e:
+                sys.exit(f"{e}; raise --voice-capacity or drop a limit")
+
+    all_texts = profiler.wrap("load", run_texts())
+    if normalizer:
+        all_texts = profiler.wrap("normalize", normalizer.tap(all_texts))
+
+    # Optional analyzers, cached per text hash so only new texts or analyzers are computed
+    analysis = None
+    if args.analyze:
+        analysis = Analysis(parse_analyzers(args.analyze),
+                            os.path.splitext(output_path)[0] + ".metrics.csv", args.workers)
+
+    # Process: calculate metrics and assign voices
+    all_texts = profiler.wrap("process_texts", process_texts(
+        all_texts, reuse=incremental.lookup, rate_model=rate_model, scheduler=scheduler, analysis=analysis))
+
+    if ledger:
+        all_texts = ledger.tap(all_texts, args.month)
+
+    # Optional chunking: size-bounded pieces for parallel synthesis, written as rows stream past
+    chunk_writer = None
+    if args.chunk_size:
+        chunk_writer = ChunkWriter(os.path.splitext(output_path)[0] + ".chunks.csv", args.chunk_size)
+        all_texts = profiler.wrap("chunking", chunk_writer.tap(all_texts))
+
+    # Write CSV (always; incremental runs reuse it) plus any columnar formats
+    writers = open_outputs(output_path, ["csv"] + [f for f in parse_formats(args.formats) if f != "csv"])
+    sharded = None
+    if args.shard_by:
+        sharded = ShardedCsvOutput(output_path, args.shard_by, args.shard_rows)
+        writers.append(sharded)
+    with profiler.stage("write_csv"):
+        try:
+            stats = write_outputs(all_texts, writers)
+        except VoiceCapacityError as e:  # texts the plan did not see; the writers discard their temp files
+            sys.exit(f"{e}; raise --voice-capacity or drop a limit")
+        incremental.save()
+    profiler.count("write_csv", len(stats))
+    if ledger:
+        ledger.commit()
 
     # Print stats
-    print_stats(all_texts)
+    with profiler.stage("print_stats"):
+        print_stats(stats)
+    profiler.count("print_stats", len(stats))
+    if args.stats_json:
+        stats.write_json(args.stats_json)
+        print(f"Stats JSON written to: {args.stats_json}")
+    print(incremental.summary())
+    if ledger:
+        print(ledger.summary(args.month))
+        ledger.close()
+    if normalizer:
+        print(normalizer.summary())
+        normalized_path = os.path.splitext(output_path)[0] + ".normalized.csv"
+        normalizer.write_report(normalized_path)
+        if normalizer.changed:
+            print(f"Normalization report written to: {normalized_path}")
+    if isinstance(scheduler, BalancedScheduler):
+        print(scheduler.report())
+    if analysis:
+        print(analysis.summary())
+        print(f"Metrics written to: {analysis.metrics_path}")
+    if chunk_writer:
+        print(chunk_writer.summary())
+        print(f"Chunks written to: {chunk_writer.path}")
+    if budget:
+        deferred_path = os.path.splitext(output_path)[0] + ".deferred.csv"
+        write_deferred_report(budget, deferred_path)
+        print(budget.summary())
+        print(f"Deferred texts written to: {deferred_path}")
+    if sharded:
+        print(sharded.summary())
+    for writer in writers[1:]:
+        if writer is sharded:
+            continue
+        print(f"{writer.extension[1:].capitalize()} written to: {writer.path}")
     print(f"CSV written to: {output_path}")
 
+    if profiler.enabled:
+        report = profiler.stop()
+        report["texts"] = len(stats)
+        report_path = os.path.splitext(output_path)[0] + ".run.json"
+        write_report(report, report_path)
+        print_report(report)
+        print(f"Run report written to: {report_path}")
+        for path in (args.cprofile, args.flamegraph):
+            if path:
+                print(f"Profile written to: {path}")
+
+    if args.watch:
+        def reprocess(text: dict, voice_id: str | None) -> dict:
+            # The plan was made for the text as it was; an edit may have changed its gender
+            if isinstance(scheduler, BalancedScheduler):
+                scheduler.forget(text["id"])
+            return process_text(text, scheduler, rate_model, voice_id)
+
+        watcher = Watcher(output_path, settings, reprocess,
+                          normalize=not args.no_normalize, check_schema=not args.no_validate,
+                          interval=args.watch_interval)
+        watcher.run()
+
 
 if __name__ == "__main__":
     main()
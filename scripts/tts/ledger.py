@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+SQLite run ledger for monthly TTS batches.
+Records every produced row's id, content hash, month, voice and characters,
+so generating month N streams only texts that no other month has produced
+with their current content; rerunning month N replaces that month's rows.
+The pending set is an anti-join of the current corpus against the ledger's
+(id, hash) primary key, so it stays an index lookup per text however many
+months have been produced.
+
+Usage:
+    python scripts/tts/ledger.py            # rows and characters per month
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import CACHE_DIR
+from manifest import text_hash
+
+LEDGER_PATH = os.path.join(CACHE_DIR, "ledger.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS produced (
+    id TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    month INTEGER NOT NULL,
+    voice_id TEXT NOT NULL,
+    characters INTEGER NOT NULL,
+    recorded_at TEXT NOT NULL,
+    PRIMARY KEY (id, hash)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS produced_month ON produced (month);
+"""
+
+
+class Ledger:
+    """Which (id, content hash) pairs were produced, and in which month."""
+
+    def __init__(self, path: str = LEDGER_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+        self.pending_count = 0
+        self.skipped_count = 0
+        self.changed_count = 0
+        self._recorded: list[tuple] = []
+        self._month: int | None = None
+
+    def pending(self, texts: Iterable[dict], month: int) -> set[str]:
+        """Ids of texts that no month other than ``month`` produced with their current content."""
+        db = self.db
+        db.execute("DROP TABLE IF EXISTS temp.candidates")
+        db.execute("CREATE TEMP TABLE candidates (id TEXT PRIMARY KEY, hash TEXT NOT NULL) WITHOUT ROWID")
+        db.executemany("INSERT OR REPLACE INTO candidates VALUES (?, ?)",
+                       ((text["id"], text_hash(text)) for text in texts))
+
+        # Rows recorded under month N itself are pending again, so rerunning a month regenerates it
+        pending = {row[0] for row in db.execute(
+            """SELECT c.id FROM candidates c
+               WHERE NOT EXISTS (SELECT 1 FROM produced p
+                                 WHERE p.id = c.id AND p.hash = c.hash AND p.month != ?)""",
+            (month,))}
+        # Pending ids another month produced under an older hash were edited since
+        self.changed_count = db.execute(
+            """SELECT COUNT(DISTINCT c.id) FROM candidates c JOIN produced p ON p.id = c.id
+               WHERE p.month != ? AND p.hash != c.hash
+                 AND NOT EXISTS (SELECT 1 FROM produced q
+                                 WHERE q.id = c.id AND q.hash = c.hash AND q.month != ?)""",
+            (month, month)).fetchone()[0]
+        total = db.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+        db.execute("DROP TABLE temp.candidates")
+
+        self.pending_count = len(pending)
+        self.skipped_count = total - len(pending)
+        return pending
+
+    def tap(self, rows: Iterable[dict], month: int) -> Iterator[dict]:
+        """Yield processed rows unchanged, queueing them to be recorded under ``month``."""
+        recorded_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        self._month = month
+        for row in rows:
+            self._recorded.append((row["id"], text_hash(row), month, row["voice_id"],
+                                   row["character_count"], recorded_at))
+            yield row
+
+    def commit(self):
+        """Record queued rows as the whole of their month; call only once the outputs are safely written.
+
+        The month's CSV was rewritten, so its previous rows are replaced. Rows of
+        other months are never moved: a pair already recorded elsewhere is kept.
+        """
+        with self.db:
+            if self._month is not None:
+                self.db.execute("DELETE FROM produced WHERE month = ?", (self._month,))
+            self.db.executemany(
+                "INSERT INTO produced VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (id, hash) DO NOTHING",
+                self._recorded)
+        self._recorded = []
+
+    def months(self) -> list[tuple[int, int, int]]:
+        """(month, rows, characters) for every month in the ledger."""
+        return self.db.execute(
+            "SELECT month, COUNT(*), SUM(characters) FROM produced GROUP BY month ORDER BY month").fetchall()
+
+    def summary(self, month: int) -> str:
+        new = self.pending_count - self.changed_count
+        return (f"Ledger: month {month}: {self.pending_count} pending ({new} new, "
+                f"{self.changed_count} changed), {self.skipped_count} already produced")
+
+    def close(self):
+        self.db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show what the run ledger has recorded per month.")
+    parser.add_argument("--ledger", default=LEDGER_PATH, help="Ledger database path")
+    args = parser.parse_args()
+
+    if not os.path.exists(args.ledger):
+        sys.exit(f"No ledger at {args.ledger}")
+    ledger = Ledger(args.ledger)
+    months = ledger.months()
+    if not months:
+        print("Ledger is empty")
+    for month, rows, characters in months:
+        print(f"  month {month:>2}: {rows:5d} rows | {characters:>9,} chars")
+    ledger.close()
+
+
+if __name__ == "__main__":
+    main()
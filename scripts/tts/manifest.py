@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Per-text content-hash manifest for incremental CSV regeneration.
+Stores a hash of each text's id, text_romanian, topic and speaker_gender
+next to the generated CSV, so reruns only recompute rows that changed.
+"""
+
+import hashlib
+import json
+import os
+
+from corpus import iter_csv_rows
+
+MANIFEST_VERSION = 1
+
+# Source fields that decide a row's output
+HASHED_FIELDS = ["id", "text_romanian", "topic", "speaker_gender"]
+
+
+def text_hash(text: dict) -> str:
+    """Return a 12-hex content hash over a text's HASHED_FIELDS."""
+    payload = json.dumps([text.get(f) for f in HASHED_FIELDS], ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:12]
+
+
+def manifest_path_for(csv_path: str) -> str:
+    """romanian_month1_124k.csv -> romanian_month1_124k.manifest.json"""
+    return os.path.splitext(csv_path)[0] + ".manifest.json"
+
+
+def load_manifest(path: str, settings: str = "") -> dict[str, str]:
+    """Load id -> hash from a manifest file; an absent or stale file yields {}.
+
+    ``settings`` identifies run-wide inputs (e.g. the duration model); rows
+    produced under different settings are never reused.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != MANIFEST_VERSION or data.get("settings", "") != settings:
+        return {}
+    return data.get("texts", {})
+
+
+def load_csv_rows(path: str) -> dict[str, dict]:
+    """Load the metric columns of a previously written CSV, keyed by id."""
+    rows = {}
+    if not os.path.exists(path):
+        return rows
+    for row in iter_csv_rows(path):
+        del row["text_romanian"]
+        rows[row["id"]] = row
+    return rows
+
+
+def write_manifest(csv_path: str, settings: str, texts: dict[str, str],
+                   changed: list[str], added: list[str], removed: list[str]):
+    """Write a CSV's manifest atomically: id -> hash, plus what changed since the last one."""
+    data = {
+        "version": MANIFEST_VERSION,
+        "csv": os.path.basename(csv_path),
+        "settings": settings,
+        "texts": texts,
+        "changed": changed,
+        "added": added,
+        "removed": removed,
+    }
+    manifest_path = manifest_path_for(csv_path)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=1)
+    os.replace(tmp_path, manifest_path)
+
+
+class IncrementalState:
+    """Tracks which texts can reuse their previous CSV row during one run."""
+
+    def __init__(self, csv_path: str, full: bool = False, settings: str = ""):
+        self.csv_path = csv_path
+        self.settings = settings
+        self.manifest_path = manifest_path_for(csv_path)
+        self.previous = {} if full else load_manifest(self.manifest_path, settings)
+        self.rows = load_csv_rows(csv_path) if self.previous else {}
+        self.current: dict[str, str] = {}
+        self.changed: list[str] = []
+        self.added: list[str] = []
+
+    def reusable_voice(self, text: dict) -> str | None:
+        """The voice of the previous row a text will reuse, without recording anything."""
+        text_id = text["id"]
+        if text_id in self.rows and self.previous.get(text_id) == text_hash(text):
+            return self.rows[text_id]["voice_id"]
+        return None
+
+    def lookup(self, text: dict) -> dict | None:
+        """Record the text's hash; return its previous row if the content is unchanged."""
+        text_id = text["id"]
+        digest = text_hash(text)
+        self.current[text_id] = digest
+
+        previous = self.previous.get(text_id)
+        if previous == digest and text_id in self.rows:
+            return self.rows[text_id]
+        if previous is None:
+            self.added.append(text_id)
+        else:
+            self.changed.append(text_id)
+        return None
+
+    @property
+    def removed(self) -> list[str]:
+        return [text_id for text_id in self.previous if text_id not in self.current]
+
+    @property
+    def unchanged_count(self) -> int:
+        return len(self.current) - len(self.changed) - len(self.added)
+
+    def save(self):
+        """Write the manifest atomically, listing what changed for downstream consumers."""
+        write_manifest(self.csv_path, self.settings, self.current, self.changed, self.added, self.removed)
+
+    def summary(self) -> str:
+        return (f"Incremental: {self.unchanged_count} unchanged, {len(self.changed)} changed, "
+                f"{len(self.added)} added, {len(self.removed)} removed")
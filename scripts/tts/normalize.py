@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Diacritic normalization for text_romanian.
+The level modules can mix Unicode forms: legacy cedilla ş/ţ next to the
+correct comma-below ș/ț, decomposed letter + combining mark sequences, and
+ã typed for ă. TTS engines pronounce (and sometimes bill) these differently.
+Each text is composed to NFC and then mapped through one precomputed
+str.translate table, both single C-level passes, and every change is
+recorded per text.
+"""
+
+import csv
+import os
+import unicodedata
+from collections import Counter
+from typing import Iterable, Iterator
+
+# Wrong or legacy character -> canonical Romanian character. Applied after NFC,
+# which composes s/t + combining cedilla into the cedilla letters handled here.
+CANONICAL = {
+    "ş": "ș", "Ş": "Ș",  # s with cedilla -> comma below
+    "ţ": "ț", "Ţ": "Ț",  # t with cedilla -> comma below
+    "ã": "ă", "Ã": "Ă",  # a with tilde, from legacy keyboard layouts
+}
+
+TRANSLATION = str.maketrans(CANONICAL)
+
+# Characters that can only appear in a text needing the table
+_SUSPECT = frozenset(CANONICAL)
+
+REPORT_FIELDNAMES = ["id", "changes"]
+
+# Per-text lines printed to the console; the rest go to the report file only
+PRINT_LIMIT = 20
+
+
+def normalize_text(romanian: str) -> tuple[str, Counter]:
+    """Canonical form of a text and a count of each "old→new" change made."""
+    changes = Counter()
+    if not unicodedata.is_normalized("NFC", romanian):
+        composed = unicodedata.normalize("NFC", romanian)
+        # Each composed mark shortens the text by one; reordering alone still counts once
+        changes["NFC"] = max(len(romanian) - len(composed), 1)
+        romanian = composed
+    if not _SUSPECT.isdisjoint(romanian):
+        for char in _SUSPECT.intersection(romanian):
+            changes[f"{char}→{CANONICAL[char]}"] = romanian.count(char)
+        romanian = romanian.translate(TRANSLATION)
+    return romanian, changes
+
+
+class Normalizer:
+    """Canonicalises text_romanian as texts stream past, recording what changed."""
+
+    def __init__(self):
+        self.changed: dict[str, Counter] = {}
+        self.totals = Counter()
+        self.seen = 0
+
+    def tap(self, texts: Iterable[dict]) -> Iterator[dict]:
+        for text in texts:
+            self.seen += 1
+            romanian, changes = normalize_text(text["text_romanian"])
+            if changes:
+                text["text_romanian"] = romanian
+                self.changed[text["id"]] = changes
+                self.totals.update(changes)
+            yield text
+
+    def summary(self) -> str:
+        if not self.changed:
+            return f"Normalization: {self.seen} texts already canonical"
+        totals = ", ".join(f"{change} ×{count}" for change, count in self.totals.most_common())
+        lines = [f"Normalization: {len(self.changed)} of {self.seen} texts changed ({totals})"]
+        for text_id, changes in list(self.changed.items())[:PRINT_LIMIT]:
+            lines.append(f"  {text_id}: " + ", ".join(f"{c} ×{n}" for c, n in changes.most_common()))
+        if len(self.changed) > PRINT_LIMIT:
+            lines.append(f"  ... and {len(self.changed) - PRINT_LIMIT} more")
+        return "\n".join(lines)
+
+    def write_report(self, path: str):
+        """One row per changed text; an unchanged corpus removes any stale report."""
+        if not self.changed:
+            if os.path.exists(path):
+                os.remove(path)
+            return
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(REPORT_FIELDNAMES)
+            for text_id, changes in self.changed.items():
+                writer.writerow([text_id, "; ".join(f"{c} ×{n}" for c, n in changes.most_common())])
+        os.replace(tmp_path, path)
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Output formats for processed corpus rows.
+CSV stays the default for the TS scripts. The columnar backends (Parquet
+and Arrow IPC, via the optional pyarrow dependency) keep real dtypes and
+dictionary-encode level/topic/speaker_gender/voice_id, so downstream
+loaders can read only the columns they need without reparsing text.
+Rows are written in record batches, so memory stays flat on large corpora.
+"""
+
+import csv
+import os
+from abc import ABC, abstractmethod
+from typing import Iterable
+
+FIELDNAMES = [
+    "id", "level", "text_romanian", "topic", "word_count",
+    "character_count", "speaker_gender", "voice_id", "speed",
+    "estimated_duration_sec"
+]
+
+DICTIONARY_COLUMNS = ["level", "topic", "speaker_gender", "voice_id"]
+
+BATCH_ROWS = 8192
+
+# format name -> file extension
+FORMATS = {"csv": ".csv", "parquet": ".parquet", "arrow": ".arrow"}
+
+
+class OutputWriter(ABC):
+    """Writes rows to a temp file and swaps it into place on close."""
+
+    extension = ""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tmp_path = path + ".tmp"
+
+    def __enter__(self) -> "OutputWriter":
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(commit=exc_type is None)
+
+    @abstractmethod
+    def open(self):
+        """Create the temp file and write any header."""
+
+    @abstractmethod
+    def write(self, row: dict):
+        """Append one output row."""
+
+    def close(self, commit: bool = True):
+        if commit:
+            os.replace(self.tmp_path, self.path)
+        elif os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+
+class CsvOutput(OutputWriter):
+    extension = ".csv"
+
+    def __init__(self, path: str, fieldnames: list[str] = FIELDNAMES):
+        super().__init__(path)
+        self.fieldnames = fieldnames
+
+    def open(self):
+        self.file = open(self.tmp_path, "w", newline="", encoding="utf-8")
+        self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames)
+        self.writer.writeheader()
+
+    def write(self, row: dict):
+        self.writer.writerow(row)
+
+    def close(self, commit: bool = True):
+        self.file.close()
+        super().close(commit)
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise RuntimeError("Parquet/Arrow output needs pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+def arrow_schema():
+    pa = _import_pyarrow()
+    category = pa.dictionary(pa.int16(), pa.string())
+    return pa.schema([
+        ("id", pa.string()),
+        ("level", category),
+        ("text_romanian", pa.string()),
+        ("topic", category),
+        ("word_count", pa.uint32()),
+        ("character_count", pa.uint32()),
+        ("speaker_gender", category),
+        ("voice_id", category),
+        ("speed", pa.float32()),
+        ("estimated_duration_sec", pa.float32()),
+    ])
+
+
+class _ColumnarOutput(OutputWriter):
+    """Buffers rows column-wise and flushes them as Arrow record batches."""
+
+    def open(self):
+        self.pa = _import_pyarrow()
+        self.schema = arrow_schema()
+        self.columns: dict[str, list] = {name: [] for name in self.schema.names}
+        self._open_writer()
+
+    @abstractmethod
+    def _open_writer(self):
+        """Open the format's writer on the temp file."""
+
+    def write(self, row: dict):
+        for name, values in self.columns.items():
+            values.append(row[name])
+        if len(self.columns["id"]) >= BATCH_ROWS:
+            self._flush()
+
+    def _flush(self):
+        if not self.columns["id"]:
+            return
+        arrays = []
+        for field in self.schema:
+            values = self.columns[field.name]
+            if field.name in DICTIONARY_COLUMNS:
+                arrays.append(self.pa.array(values, self.pa.string()).dictionary_encode().cast(field.type))
+            else:
+                arrays.append(self.pa.array(values, field.type))
+        self.writer.write_batch(self.pa.record_batch(arrays, schema=self.schema))
+        for values in self.columns.values():
+            values.clear()
+
+    def close(self, commit: bool = True):
+        if commit:
+            self._flush()
+        self.writer.close()
+        super().close(commit)
+
+
+class ParquetOutput(_ColumnarOutput):
+    extension = ".parquet"
+
+    def _open_writer(self):
+        import pyarrow.parquet as pq
+        self.writer = pq.ParquetWriter(self.tmp_path, self.schema, compression="zstd")
+
+
+class ArrowOutput(_ColumnarOutput):
+    extension = ".arrow"
+
+    def _open_writer(self):
+        import pyarrow.ipc as ipc
+        self.writer = ipc.new_file(self.tmp_path, self.schema)
+
+
+OUTPUT_CLASSES = {"csv": CsvOutput, "parquet": ParquetOutput, "arrow": ArrowOutput}
+
+
+def parse_formats(spec: str) -> list[str]:
+    formats = [f.strip().lower() for f in spec.split(",") if f.strip()]
+    unknown = [f for f in formats if f not in OUTPUT_CLASSES]
+    if unknown:
+        raise ValueError(f"Unknown output format(s): {', '.join(unknown)} (choose from {', '.join(OUTPUT_CLASSES)})")
+    # Fail before a run starts rather than when the writers are opened at the end
+    if any(issubclass(OUTPUT_CLASSES[f], _ColumnarOutput) for f in formats):
+        try:
+            _import_pyarrow()
+        except RuntimeError as e:
+            raise ValueError(str(e)) from None
+    return formats
+
+
+def open_outputs(base_path: str, formats: Iterable[str]) -> list[OutputWriter]:
+    """One writer per format, sharing the base path's stem."""
+    stem = os.path.splitext(base_path)[0]
+    return [OUTPUT_CLASSES[name](stem + FORMATS[name]) for name in formats]
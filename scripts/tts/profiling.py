@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Stage-level instrumentation for generate_csv.py.
+The pipeline is a chain of generators, so stages run interleaved. Profiler
+keeps a stack of active stages and charges each one its exclusive wall and
+CPU time (time spent in nested stages is subtracted), along with the
+tracemalloc peak while it was active and the number of items it yielded.
+When disabled, every hook is a pass-through.
+
+Optional extras: a cProfile dump (.prof, for pstats/snakeviz) and a
+sampled collapsed-stack file that flamegraph.pl and speedscope read.
+tracemalloc slows allocation-heavy stages, so compare wall times between
+profiled runs rather than with unprofiled ones (bench.py times without it).
+"""
+
+import contextlib
+import cProfile
+import json
+import os
+import platform
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Iterable, Iterator
+
+from corpus import PROJECT_ROOT
+
+SAMPLE_INTERVAL = 0.005  # seconds between stack samples
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+@dataclass
+class StageRecord:
+    name: str
+    wall_sec: float = 0.0
+    cpu_sec: float = 0.0
+    peak_kb: float = 0.0
+    items: int = 0
+    calls: int = 0
+
+
+class StackSampler:
+    """Samples the main thread's stack on a timer, for flamegraph-style collapsed output."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.counts = Counter()
+        self._stop = threading.Event()
+        self._target = threading.main_thread().ident
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.counts[";".join(reversed(stack))] += 1
+
+    def write(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class Profiler:
+    """Per-stage wall/CPU/memory/item accounting across interleaved generator stages."""
+
+    def __init__(self, enabled: bool = False, cprofile_path: str | None = None,
+                 flamegraph_path: str | None = None):
+        self.enabled = enabled or bool(cprofile_path or flamegraph_path)
+        self.cprofile_path = cprofile_path
+        self.flamegraph_path = flamegraph_path
+        self.records: dict[str, StageRecord] = {}
+        # Active stages: [record, wall start, cpu start, nested wall, nested cpu]
+        self._stack: list[list] = []
+        self._cprofile = None
+        self._sampler = None
+        self._started = 0.0
+        self._cpu_started = 0.0
+        # Stages reset tracemalloc's peak, so the run's overall peak is kept here
+        self._peak_kb = 0.0
+
+    def start(self):
+        if not self.enabled:
+            return
+        tracemalloc.start()
+        if self.flamegraph_path:
+            self._sampler = StackSampler()
+            self._sampler.start()
+        if self.cprofile_path:
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        self._started = time.perf_counter()
+        self._cpu_started = time.process_time()
+
+    def _record(self, name: str) -> StageRecord:
+        record = self.records.get(name)
+        if record is None:
+            record = self.records[name] = StageRecord(name)
+        return record
+
+    def _enter(self, record: StageRecord):
+        peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+        self._peak_kb = max(self._peak_kb, peak_kb)
+        if self._stack:
+            parent = self._stack[-1][0]
+            parent.peak_kb = max(parent.peak_kb, peak_kb)
+        tracemalloc.reset_peak()
+        self._stack.append([record, time.perf_counter(), time.process_time(), 0.0, 0.0])
+
+    def _exit(self):
+        record, wall_start, cpu_start, nested_wall, nested_cpu = self._stack.pop()
+        wall = time.perf_counter() - wall_start
+        cpu = time.process_time() - cpu_start
+        record.wall_sec += wall - nested_wall
+        record.cpu_sec += cpu - nested_cpu
+        record.calls += 1
+        peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+        record.peak_kb = max(record.peak_kb, peak_kb)
+        if self._stack:
+            parent = self._stack[-1]
+            parent[3] += wall
+            parent[4] += cpu
+            parent[0].peak_kb = max(parent[0].peak_kb, peak_kb)
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Time an eager stage (one that runs to completion when called)."""
+        if not self.enabled:
+            yield
+            return
+        self._enter(self._record(name))
+        try:
+            yield
+        finally:
+            self._exit()
+
+    def wrap(self, name: str, iterable: Iterable) -> Iterable:
+        """Time a lazy stage: only the work done inside its next() calls is charged to it."""
+        if not self.enabled:
+            return iterable
+        return self._wrap(self._record(name), iterable)
+
+    def _wrap(self, record: StageRecord, iterable: Iterable) -> Iterator:
+        iterator = iter(iterable)
+        while True:
+            self._enter(record)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                self._exit()
+            record.items += 1
+            yield item
+
+    def counted(self, name: str, iterable: Iterable) -> Iterable:
+        """Count the items an eager stage consumes, leaving the timing to stage()."""
+        if not self.enabled:
+            return iterable
+        return self._counted(self._record(name), iterable)
+
+    def _counted(self, record: StageRecord, iterable: Iterable) -> Iterator:
+        for item in iterable:
+            record.items += 1
+            yield item
+
+    def count(self, name: str, items: int):
+        """Set the item count of an eager stage."""
+        if self.enabled:
+            self._record(name).items = items
+
+    def stop(self) -> dict:
+        """Stop collecting and return the run report."""
+        wall = time.perf_counter() - self._started
+        cpu = time.process_time() - self._cpu_started
+        peak_kb = max(self._peak_kb, tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+        if self._cprofile:
+            self._cprofile.disable()
+            self._cprofile.dump_stats(self.cprofile_path)
+        if self._sampler:
+            self._sampler.stop()
+            self._sampler.write(self.flamegraph_path)
+        stages = [asdict(r) for r in self.records.values()]
+        for stage in stages:
+            for key in ("wall_sec", "cpu_sec"):
+                stage[key] = round(stage[key], 4)
+            stage["peak_kb"] = round(stage["peak_kb"], 1)
+        return {
+            "meta": {
+                "revision": git_revision(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "argv": sys.argv[1:],
+            },
+            "total": {"wall_sec": round(wall, 4), "cpu_sec": round(cpu, 4), "peak_kb": round(peak_kb, 1)},
+            "stages": stages,
+        }
+
+
+def print_report(report: dict):
+    total = report["total"]
+    print(f"\nProfile ({total['wall_sec']:.3f}s wall, {total['cpu_sec']:.3f}s CPU, "
+          f"peak {total['peak_kb'] / 1024:,.1f} MiB traced):")
+    print(f"  {'stage':<16} {'wall s':>8} {'cpu s':>8} {'share':>6} {'peak MiB':>9} {'items':>8}")
+    for stage in report["stages"]:
+        share = stage["wall_sec"] / total["wall_sec"] * 100 if total["wall_sec"] else 0.0
+        print(f"  {stage['name']:<16} {stage['wall_sec']:>8.3f} {stage['cpu_sec']:>8.3f} {share:>5.1f}% "
+              f"{stage['peak_kb'] / 1024:>9.1f} {stage['items']:>8,}")
+
+
+def write_report(report: dict, path: str):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_path, path)
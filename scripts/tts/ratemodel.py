@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Measured speech-rate model replacing the hand-derived CHARS_PER_SEC constant.
+Fits a linear duration model per (voice_id, speed) from WAV files of audio
+that has already been synthesised, using character count, word count,
+punctuation pauses and dialogue turns as features. Voices with too few
+samples fall back to a pooled model fitted over every voice.
+
+Usage:
+    python scripts/tts/ratemodel.py fit [csv] --audio-dir DIR     # <id>.wav files
+    python scripts/tts/ratemodel.py fit [csv] --cache-dir DIR     # AudioCache WAV blobs
+    python scripts/tts/ratemodel.py report [csv] --audio-dir DIR  # error of the saved model
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import wave
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from audio_cache import AudioCache, row_key
+from corpus import CACHE_DIR, PROJECT_ROOT, iter_csv_rows
+
+RATE_MODEL_PATH = os.path.join(CACHE_DIR, "rate_model.json")
+
+FEATURES = ["intercept", "characters", "words", "pauses", "turns"]
+
+# Fewer samples than this and a voice uses the pooled model
+MIN_SAMPLES = len(FEATURES) + 3
+
+# Small ridge term keeps the normal equations solvable when features are collinear
+RIDGE = 1e-6
+
+PAUSE_RE = re.compile(r"[.,;:!?…]")
+TURN_RE = re.compile(r"(?:^|\n)- ")
+
+
+def features(romanian: str) -> list[float]:
+    return [
+        1.0,
+        float(len(romanian)),
+        float(len(romanian.split())),
+        float(len(PAUSE_RE.findall(romanian))),
+        float(len(TURN_RE.findall(romanian))),
+    ]
+
+
+def model_key(voice_id: str, speed: float) -> str:
+    return f"{voice_id}@{float(speed):g}"
+
+
+def wav_duration(path: str) -> float:
+    with wave.open(path, "rb") as w:
+        return w.getnframes() / w.getframerate()
+
+
+def _solve(a: list[list[float]], b: list[float]) -> list[float]:
+    """Solve a small dense system by Gaussian elimination with partial pivoting."""
+    n = len(b)
+    m = [row[:] + [b[i]] for i, row in enumerate(a)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(m[r][col]))
+        m[col], m[pivot] = m[pivot], m[col]
+        if m[col][col] == 0:
+            raise ValueError("singular system")
+        for r in range(col + 1, n):
+            factor = m[r][col] / m[col][col]
+            for c in range(col, n + 1):
+                m[r][c] -= factor * m[col][c]
+    x = [0.0] * n
+    for r in range(n - 1, -1, -1):
+        x[r] = (m[r][n] - sum(m[r][c] * x[c] for c in range(r + 1, n))) / m[r][r]
+    return x
+
+
+def fit_least_squares(xs: list[list[float]], ys: list[float]) -> list[float]:
+    """Ridge-regularised least squares via the normal equations."""
+    k = len(xs[0])
+    xtx = [[0.0] * k for _ in range(k)]
+    xty = [0.0] * k
+    for x, y in zip(xs, ys):
+        for i in range(k):
+            xty[i] += x[i] * y
+            for j in range(k):
+                xtx[i][j] += x[i] * x[j]
+    scale = max(xtx[i][i] for i in range(k))
+    for i in range(k):
+        xtx[i][i] += RIDGE * scale
+    return _solve(xtx, xty)
+
+
+class RateModel:
+    """Per-(voice, speed) linear duration model with a pooled fallback."""
+
+    def __init__(self, coefficients: dict[str, list[float]], pooled: list[float] | None,
+                 samples: dict[str, int] | None = None):
+        self.coefficients = coefficients
+        self.pooled = pooled
+        self.samples = samples or {}
+
+    @classmethod
+    def fit(cls, samples: list[tuple[dict, float]]) -> "RateModel":
+        """Fit from (row, measured seconds) pairs."""
+        by_key: dict[str, list[tuple[list[float], float]]] = {}
+        for row, seconds in samples:
+            by_key.setdefault(model_key(row["voice_id"], row["speed"]), []).append(
+                (features(row["text_romanian"]), seconds))
+
+        pooled = None
+        if len(samples) >= MIN_SAMPLES:
+            pairs = [p for group in by_key.values() for p in group]
+            pooled = fit_least_squares([x for x, _ in pairs], [y for _, y in pairs])
+
+        coefficients = {}
+        for key, pairs in by_key.items():
+            if len(pairs) >= MIN_SAMPLES:
+                coefficients[key] = fit_least_squares([x for x, _ in pairs], [y for _, y in pairs])
+        return cls(coefficients, pooled, {key: len(pairs) for key, pairs in by_key.items()})
+
+    @classmethod
+    def load(cls, path: str = RATE_MODEL_PATH) -> "RateModel | None":
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            try:
+                data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{path} is not valid JSON ({e.msg}); refit it") from e
+        if data.get("features") != FEATURES:
+            raise ValueError(f"{path} was fitted with different features; refit it")
+        return cls(data["coefficients"], data.get("pooled"), data.get("samples"))
+
+    def save(self, path: str = RATE_MODEL_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({
+                "features": FEATURES,
+                "coefficients": self.coefficients,
+                "pooled": self.pooled,
+                "samples": self.samples,
+            }, f, indent=2)
+        os.replace(tmp_path, path)
+
+    def fingerprint(self) -> str:
+        """Stable identity of the fitted parameters, for cache invalidation."""
+        return json.dumps([self.coefficients, self.pooled], sort_keys=True)
+
+    def predict(self, romanian: str, voice_id: str, speed: float) -> float | None:
+        """Predicted seconds, or None if no model covers this voice."""
+        coef = self.coefficients.get(model_key(voice_id, speed), self.pooled)
+        if coef is None:
+            return None
+        return max(0.1, sum(c * x for c, x in zip(coef, features(romanian))))
+
+
+def collect_samples(rows: list[dict], audio_dir: str | None, cache_dir: str | None) -> list[tuple[dict, float]]:
+    """Pair CSV rows with measured WAV durations from an audio dir or the audio cache."""
+    cache = AudioCache(cache_dir, extension="wav") if cache_dir else None
+    samples = []
+    for row in rows:
+        if audio_dir:
+            path = os.path.join(audio_dir, f"{row['id']}.wav")
+        else:
+            path = cache.path_for(row_key(row))
+        if os.path.exists(path):
+            samples.append((row, wav_duration(path)))
+    return samples
+
+
+def error_report(samples: list[tuple[dict, float]], model: RateModel | None, chars_per_sec: float) -> str:
+    """MAE/MAPE of the fitted model against the constant-rate baseline."""
+    def errors(predict) -> tuple[float, float]:
+        abs_err = [abs(predict(row) - seconds) for row, seconds in samples]
+        pct_err = [e / seconds for e, (_, seconds) in zip(abs_err, samples) if seconds > 0]
+        return sum(abs_err) / len(abs_err), sum(pct_err) / max(len(pct_err), 1) * 100
+
+    def baseline(row: dict) -> float:
+        return len(row["text_romanian"]) / chars_per_sec
+
+    def fitted(row: dict) -> float:
+        predicted = model.predict(row["text_romanian"], row["voice_id"], row["speed"]) if model else None
+        return baseline(row) if predicted is None else predicted
+
+    base_mae, base_mape = errors(baseline)
+    lines = [f"Samples: {len(samples)}",
+             f"  CHARS_PER_SEC={chars_per_sec}: MAE {base_mae:6.2f}s | MAPE {base_mape:5.1f}%"]
+    if model:
+        mae, mape = errors(fitted)
+        lines.append(f"  Fitted model:        MAE {mae:6.2f}s | MAPE {mape:5.1f}%")
+        lines.append(f"  Per-voice models: {len(model.coefficients)}, pooled: {'yes' if model.pooled else 'no'}")
+    return "\n".join(lines)
+
+
+def main():
+    # Imported here: generate_csv imports this module for the fitted model
+    from generate_csv import CHARS_PER_SEC
+
+    parser = argparse.ArgumentParser(description="Fit or evaluate the speech-rate model from synthesised WAVs.")
+    parser.add_argument("command", choices=["fit", "report"])
+    parser.add_argument("csv", nargs="?", default=os.path.join(PROJECT_ROOT, "romanian_month1_124k.csv"))
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--audio-dir", help="Directory of <id>.wav files")
+    source.add_argument("--cache-dir", help="AudioCache directory holding WAV blobs")
+    parser.add_argument("--model", default=RATE_MODEL_PATH)
+    args = parser.parse_args()
+
+    rows = list(iter_csv_rows(args.csv))
+    samples = collect_samples(rows, args.audio_dir, args.cache_dir)
+    if not samples:
+        sys.exit("No WAV files found for the CSV rows")
+
+    if args.command == "fit":
+        model = RateModel.fit(samples)
+        if model.pooled is None:
+            sys.exit(f"Need at least {MIN_SAMPLES} samples to fit, found {len(samples)}")
+        model.save(args.model)
+        print(f"Model written to: {args.model}")
+    else:
+        try:
+            model = RateModel.load(args.model)
+        except ValueError as e:  # stale features or a corrupt file
+            sys.exit(str(e))
+
+    print(error_report(samples, model, CHARS_PER_SEC))
+
+
+if __name__ == "__main__":
+    main()
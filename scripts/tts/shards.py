@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Sharded CSV output for very large corpora.
+Rows are split by level or into fixed-size row-count shards, and each shard
+is written by its own thread fed through a bounded queue, so the main stream
+keeps processing while shards drain to disk concurrently. A manifest.json
+next to the shards lists each file with its row count and character total,
+so consumers can fan out over shards without opening them first.
+"""
+
+import csv
+import json
+import os
+import queue
+import threading
+
+from outputs import FIELDNAMES, OutputWriter
+
+SHARD_BY = ["level", "rows"]
+DEFAULT_SHARD_ROWS = 50_000
+
+# Rows are handed to shard threads in batches to keep queue overhead low
+BATCH_ROWS = 512
+QUEUE_BATCHES = 8
+
+
+class _Shard:
+    """One shard file, written by a background thread."""
+
+    def __init__(self, name: str, path: str, fieldnames: list[str]):
+        self.name = name
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.fieldnames = fieldnames
+        self.rows = 0
+        self.characters = 0
+        self.batch: list[dict] = []
+        self.ended = False
+        self.error: BaseException | None = None
+        self.queue: queue.Queue = queue.Queue(maxsize=QUEUE_BATCHES)
+        self.thread = threading.Thread(target=self._run, name=f"shard-{name}", daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        try:
+            with open(self.tmp_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=self.fieldnames)
+                writer.writeheader()
+                while (batch := self.queue.get()) is not None:
+                    writer.writerows(batch)
+        except BaseException as e:
+            self.error = e
+            # Keep draining so the producer never blocks on a dead writer
+            while self.queue.get() is not None:
+                pass
+
+    def write(self, row: dict):
+        self.rows += 1
+        self.characters += row["character_count"]
+        self.batch.append(row)
+        if len(self.batch) >= BATCH_ROWS:
+            self.flush()
+
+    def flush(self):
+        if self.batch:
+            self.queue.put(self.batch)
+            self.batch = []
+
+    def end(self):
+        """Flush the last batch and tell the thread no more rows are coming."""
+        if not self.ended:
+            self.flush()
+            self.queue.put(None)
+            self.ended = True
+
+    def entry(self) -> dict:
+        return {"file": os.path.basename(self.path), "name": self.name,
+                "rows": self.rows, "characters": self.characters}
+
+
+class ShardedCsvOutput(OutputWriter):
+    """Split rows across shard CSVs in <stem>.shards/, described by manifest.json.
+
+    self.path is the manifest, which is replaced last, so it only ever lists
+    shards that were completely written.
+    """
+
+    extension = ".shards"
+
+    def __init__(self, base_path: str, by: str = "level", shard_rows: int = DEFAULT_SHARD_ROWS,
+                 fieldnames: list[str] = FIELDNAMES):
+        if by not in SHARD_BY:
+            raise ValueError(f"Unknown shard mode '{by}' (choose from {', '.join(SHARD_BY)})")
+        if shard_rows < 1:
+            raise ValueError("shard_rows must be positive")
+        self.stem = os.path.basename(os.path.splitext(base_path)[0])
+        self.directory = os.path.splitext(base_path)[0] + self.extension
+        super().__init__(os.path.join(self.directory, "manifest.json"))
+        self.by = by
+        self.shard_rows = shard_rows
+        self.fieldnames = fieldnames
+        self.shards: dict[str, _Shard] = {}
+        self.current: _Shard | None = None
+
+    def open(self):
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _shard(self, name: str) -> _Shard:
+        shard = self.shards.get(name)
+        if shard is None:
+            path = os.path.join(self.directory, f"{self.stem}.{name}.csv")
+            shard = self.shards[name] = _Shard(name, path, self.fieldnames)
+        return shard
+
+    def write(self, row: dict):
+        if self.by == "level":
+            shard = self._shard(row["level"])
+        else:
+            shard = self.current
+            if shard is None or shard.rows >= self.shard_rows:
+                if shard is not None:
+                    # A full shard gets no more rows; it drains in the background
+                    shard.end()
+                shard = self.current = self._shard(f"{len(self.shards):05d}")
+        shard.write(row)
+
+    def close(self, commit: bool = True):
+        for shard in self.shards.values():
+            shard.end()
+        for shard in self.shards.values():
+            shard.thread.join()
+        errors = [shard.error for shard in self.shards.values() if shard.error]
+        if errors:
+            commit = False
+
+        if not commit:
+            for shard in self.shards.values():
+                if os.path.exists(shard.tmp_path):
+                    os.remove(shard.tmp_path)
+            if errors:
+                raise errors[0]
+            return
+
+        stale = set(self._listed_files()) - {os.path.basename(s.path) for s in self.shards.values()}
+        for shard in self.shards.values():
+            os.replace(shard.tmp_path, shard.path)
+        self._write_manifest()
+        for name in stale:
+            path = os.path.join(self.directory, name)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _listed_files(self) -> list[str]:
+        """Shard files named by the previous manifest, if any."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return [entry["file"] for entry in json.load(f)["shards"]]
+        except (OSError, ValueError, KeyError):
+            return []
+
+    def _write_manifest(self):
+        entries = [shard.entry() for shard in self.shards.values()]
+        manifest = {
+            "version": 1,
+            "by": self.by,
+            "fieldnames": self.fieldnames,
+            "rows": sum(e["rows"] for e in entries),
+            "characters": sum(e["characters"] for e in entries),
+            "shards": entries,
+        }
+        if self.by == "rows":
+            manifest["shard_rows"] = self.shard_rows
+        with open(self.tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(self.tmp_path, self.path)
+
+    def summary(self) -> str:
+        rows = sum(s.rows for s in self.shards.values())
+        return f"Shards: {len(self.shards)} files by {self.by}, {rows:,} rows in {self.directory}"
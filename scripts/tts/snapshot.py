@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Compiled binary snapshot of the text corpus for fast startup.
+Instead of importing (and compiling) the level modules on every run, texts
+are read from a memory-mapped file that is rebuilt automatically whenever a
+source module or shard changes.
+
+File layout (all integers little-endian):
+
+    header   magic "CLTS", u16 version, u16 reserved, u32 meta_len, u32 count
+    meta     UTF-8 JSON: source fingerprints and the level/topic/gender tables
+    records  count x RECORD (fixed width, see below)
+    strings  UTF-8 string table; records hold offsets relative to its start
+
+    RECORD   u64 id_off, u16 id_len, u64 text_off, u32 text_len,
+             u8 level, u16 topic, u8 gender (255 = missing)
+
+Usage:
+    python scripts/tts/snapshot.py          # build if stale, print load timing
+"""
+
+import glob
+import json
+import mmap
+import os
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from typing import Iterable, Iterator
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import CACHE_DIR, LEVEL_MODULES, SCRIPT_DIR, iter_module, iter_shard
+
+SNAPSHOT_PATH = os.path.join(CACHE_DIR, "corpus.snap")
+
+MAGIC = b"CLTS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHII")
+RECORD = struct.Struct("<QHQIBHB")
+MISSING = 255
+
+
+def source_paths(modules: Iterable[str] = LEVEL_MODULES, shard_dir: str | None = None) -> list[str]:
+    """Source files in corpus order: level modules, then sorted shard files."""
+    paths = [os.path.join(SCRIPT_DIR, f"{name}.py") for name in modules]
+    if shard_dir:
+        paths += sorted(glob.glob(os.path.join(shard_dir, "*.jsonl")))
+    return paths
+
+
+def fingerprint(paths: list[str]) -> list[list]:
+    """(path, size, mtime_ns) per source; any edit changes at least one field."""
+    result = []
+    for path in paths:
+        st = os.stat(path)
+        result.append([os.path.abspath(path), st.st_size, st.st_mtime_ns])
+    return result
+
+
+def _iter_sources(paths: list[str]) -> Iterator[dict]:
+    for path in paths:
+        if path.endswith(".py"):
+            yield from iter_module(os.path.splitext(os.path.basename(path))[0])
+        else:
+            yield from iter_shard(path)
+
+
+def build(paths: list[str], snapshot_path: str = SNAPSHOT_PATH) -> int:
+    """Stream every source into a new snapshot file; returns the record count."""
+    sources = fingerprint(paths)
+    tables: dict[str, dict[str, int]] = {"levels": {}, "topics": {}, "genders": {}}
+
+    def code(table: str, value: str) -> int:
+        return tables[table].setdefault(value, len(tables[table]))
+
+    os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+    records = bytearray()
+    count = 0
+    # Strings go to a side file so text bodies never accumulate in memory
+    with tempfile.TemporaryFile(dir=os.path.dirname(snapshot_path)) as strings:
+        offset = 0
+        for text in _iter_sources(paths):
+            id_bytes = text["id"].encode("utf-8")
+            body = text["text_romanian"].encode("utf-8")
+            strings.write(id_bytes)
+            strings.write(body)
+            gender = text.get("speaker_gender")
+            records += RECORD.pack(
+                offset, len(id_bytes),
+                offset + len(id_bytes), len(body),
+                code("levels", text["level"]),
+                code("topics", text["topic"]),
+                MISSING if gender is None else code("genders", gender),
+            )
+            offset += len(id_bytes) + len(body)
+            count += 1
+
+        meta = json.dumps({
+            "sources": sources,
+            **{name: list(values) for name, values in tables.items()},
+        }, ensure_ascii=False).encode("utf-8")
+
+        tmp_path = snapshot_path + ".tmp"
+        with open(tmp_path, "wb") as out:
+            out.write(HEADER.pack(MAGIC, VERSION, 0, len(meta), count))
+            out.write(meta)
+            out.write(records)
+            strings.seek(0)
+            shutil.copyfileobj(strings, out)
+        os.replace(tmp_path, snapshot_path)
+    return count
+
+
+def _read_header(mm) -> tuple[dict, int, int]:
+    magic, version, _, meta_len, count = HEADER.unpack_from(mm, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a current corpus snapshot")
+    meta = json.loads(mm[HEADER.size:HEADER.size + meta_len])
+    return meta, count, HEADER.size + meta_len
+
+
+def is_fresh(paths: list[str], snapshot_path: str = SNAPSHOT_PATH) -> bool:
+    if not os.path.exists(snapshot_path):
+        return False
+    try:
+        with open(snapshot_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            meta, _, _ = _read_header(mm)
+    except (ValueError, struct.error):
+        return False
+    return meta["sources"] == fingerprint(paths)
+
+
+def iter_snapshot(snapshot_path: str = SNAPSHOT_PATH) -> Iterator[dict]:
+    """Yield text dicts straight from the memory-mapped snapshot."""
+    with open(snapshot_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        meta, count, records_start = _read_header(mm)
+        levels, topics, genders = meta["levels"], meta["topics"], meta["genders"]
+        strings_start = records_start + count * RECORD.size
+        for id_off, id_len, text_off, text_len, level, topic, gender in RECORD.iter_unpack(
+                mm[records_start:strings_start]):
+            text = {
+                "id": mm[strings_start + id_off:strings_start + id_off + id_len].decode("utf-8"),
+                "level": levels[level],
+                "text_romanian": mm[strings_start + text_off:strings_start + text_off + text_len].decode("utf-8"),
+                "topic": topics[topic],
+            }
+            if gender != MISSING:
+                text["speaker_gender"] = genders[gender]
+            yield text
+
+
+def iter_texts(modules: Iterable[str] = LEVEL_MODULES, shard_dir: str | None = None,
+               snapshot_path: str = SNAPSHOT_PATH) -> Iterator[dict]:
+    """Drop-in for corpus.iter_texts that reads from the snapshot, rebuilding it if stale."""
+    paths = source_paths(modules, shard_dir)
+    if not is_fresh(paths, snapshot_path):
+        build(paths, snapshot_path)
+    yield from iter_snapshot(snapshot_path)
+
+
+def main():
+    paths = source_paths()
+    start = time.perf_counter()
+    if is_fresh(paths):
+        print("Snapshot is up to date")
+    else:
+        count = build(paths)
+        print(f"Built snapshot with {count} texts in {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    count = sum(1 for _ in iter_snapshot())
+    print(f"Loaded {count} texts from {SNAPSHOT_PATH} in {time.perf_counter() - start:.4f}s "
+          f"({os.path.getsize(SNAPSHOT_PATH):,} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Single-pass statistics engine for the generated TTS corpus.
+Rows are appended once into a CorpusTable (typed arrays plus
+dictionary-encoded level/topic/gender/voice). Group-bys bucket row indices
+from the category codes, and aggregates and percentiles are computed from
+the compact columns without revisiting the source rows.
+"""
+
+import json
+
+from columnar import CorpusTable
+
+# Grouping dimension -> categorical column
+GROUP_BY = {
+    "level": "level",
+    "topic": "topic",
+    "gender": "speaker_gender",
+    "voice": "voice_id",
+}
+
+PERCENTILES = [50, 90, 99]
+
+LEVEL_ORDER = ["A1", "A2", "B1", "B2", "C1"]
+
+
+def percentile(sorted_values, p: float) -> float:
+    """Linear-interpolated percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * p / 100
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def describe(values) -> dict:
+    """count/sum/min/max/mean plus percentiles for one numeric column slice."""
+    ordered = sorted(values)
+    if not ordered:
+        return {"count": 0, "sum": 0}
+    total = sum(ordered)
+    summary = {
+        "count": len(ordered),
+        "sum": total,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "mean": total / len(ordered),
+    }
+    for p in PERCENTILES:
+        summary[f"p{p}"] = percentile(ordered, p)
+    return summary
+
+
+def _rounded(value, ndigits: int = 1):
+    """Round every float in a nested stats dict for JSON output."""
+    if isinstance(value, dict):
+        return {k: _rounded(v, ndigits) for k, v in value.items()}
+    if isinstance(value, float):
+        return round(value, ndigits)
+    return value
+
+
+class StatsTable(CorpusTable):
+    """Columnar metrics table filled in a single pass over the rows."""
+
+    def __init__(self):
+        super().__init__()
+        self._groups: dict[str, dict] = {}
+
+    def append(self, row: dict):
+        super().append(row)
+        self._groups.clear()
+
+    def group_indices(self, dim: str) -> dict:
+        """Group value -> row indices for one GROUP_BY dimension (cached until the next append)."""
+        if dim not in self._groups:
+            self._groups[dim] = self.categoricals[GROUP_BY[dim]].group_indices()
+        return self._groups[dim]
+
+    def group_keys(self, dim: str) -> list[str]:
+        keys = list(self.group_indices(dim))
+        if dim == "level":
+            return sorted(keys, key=lambda k: (LEVEL_ORDER.index(k) if k in LEVEL_ORDER else len(LEVEL_ORDER), k))
+        return sorted(keys)
+
+    def count(self, dim: str, key: str) -> int:
+        return len(self.group_indices(dim).get(key, ()))
+
+    def aggregate(self, indices=None) -> dict:
+        """Describe the numeric columns over all rows, or over the given row indices."""
+        chars = self.numerics["character_count"]
+        words = self.numerics["word_count"]
+        duration = self.numerics["estimated_duration_sec"]
+        if indices is not None:
+            chars = [chars[i] for i in indices]
+            words = [words[i] for i in indices]
+            duration = [duration[i] for i in indices]
+        return {
+            "character_count": describe(chars),
+            "word_count": describe(words),
+            "estimated_duration_sec": describe(duration),
+        }
+
+    def to_dict(self) -> dict:
+        data = {"total_texts": len(self), "totals": self.aggregate()}
+        for dim in GROUP_BY:
+            groups = self.group_indices(dim)
+            data[f"by_{dim}"] = {key: self.aggregate(groups[key]) for key in self.group_keys(dim)}
+        return _rounded(data)
+
+    def write_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
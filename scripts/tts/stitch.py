@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Streaming WAV stitcher for chunked and multi-part synthesis output.
+Joins PCM WAV parts into one file without decoding them: each part is
+memory-mapped and its data chunk is copied straight to the output, with a
+configurable silence between parts. The RIFF header is written as a
+placeholder and rewritten once at the end, when the sizes are known, so
+memory use stays flat however many hours of audio are joined.
+
+Usage:
+    python scripts/tts/stitch.py episode.wav part1.wav part2.wav --silence 0.8
+    python scripts/tts/stitch.py --chunks romanian_month1_124k.chunks.csv --cache-dir DIR --out-dir DIR
+"""
+
+import argparse
+import csv
+import mmap
+import os
+import struct
+import sys
+from collections import defaultdict
+from typing import Iterable, NamedTuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from audio_cache import row_key
+from corpus import CACHE_DIR, FLOAT_FIELDS
+
+STITCHED_DIR = os.path.join(CACHE_DIR, "stitched")
+
+DEFAULT_SILENCE = 0.3  # seconds between sentence chunks
+WRITE_BUFFER = 1 << 20
+SILENCE_BLOCK = 1 << 16
+
+# RIFF sizes are 32-bit
+MAX_DATA_BYTES = 0xFFFFFFFF - 36
+
+
+class WavLayout(NamedTuple):
+    fmt_chunk: bytes  # the whole "fmt " chunk, header included
+    channels: int
+    sample_rate: int
+    bits: int
+    block_align: int
+    data_offset: int
+    data_size: int
+
+    @property
+    def format_key(self) -> tuple:
+        return self.channels, self.sample_rate, self.bits
+
+    def seconds(self, nbytes: int) -> float:
+        return nbytes / (self.block_align * self.sample_rate)
+
+
+def read_layout(buf) -> WavLayout:
+    """Locate the fmt and data chunks of a RIFF/WAVE buffer (bytes or mmap)."""
+    if buf[:4] != b"RIFF" or buf[8:12] != b"WAVE":
+        raise ValueError("not a RIFF/WAVE file")
+    pos, fmt = 12, None
+    while pos + 8 <= len(buf):
+        chunk_id, size = struct.unpack_from("<4sI", buf, pos)
+        body = pos + 8
+        if chunk_id == b"fmt ":
+            fmt = bytes(buf[pos:body + size])
+            audio_format, channels, rate, _, block_align, bits = struct.unpack_from("<HHIIHH", buf, body)
+            if audio_format not in (1, 0xFFFE):
+                raise ValueError(f"only PCM WAV can be stitched (format {audio_format})")
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("data chunk before fmt chunk")
+            # Streaming writers may leave 0 or 0xFFFFFFFF here; trust the file length instead
+            size = min(size, len(buf) - body) if size else len(buf) - body
+            size -= size % block_align
+            return WavLayout(fmt, channels, rate, bits, block_align, body, size)
+        pos = body + size + (size & 1)  # chunks are word-aligned
+    raise ValueError("no data chunk")
+
+
+class WavStitcher:
+    """Appends PCM parts (and silence) to one WAV, fixing the header on close."""
+
+    def __init__(self, path: str, silence_sec: float = DEFAULT_SILENCE):
+        self.path = path
+        self.tmp_path = path + ".tmp"
+        self.silence_sec = silence_sec
+        self.layout: WavLayout | None = None
+        self.file = None
+        self.data_bytes = 0
+        self.parts = 0
+
+    def __enter__(self) -> "WavStitcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close(commit=exc_type is None)
+
+    def _open(self, layout: WavLayout):
+        self.layout = layout
+        self.file = open(self.tmp_path, "wb", buffering=WRITE_BUFFER)
+        self.file.write(self._header(0))
+        fill = b"\x80" if layout.bits == 8 else b"\x00"  # 8-bit PCM is unsigned
+        self._silence = fill * (SILENCE_BLOCK - SILENCE_BLOCK % layout.block_align)
+
+    def _header(self, data_bytes: int) -> bytes:
+        fmt = self.layout.fmt_chunk
+        riff_size = 4 + len(fmt) + 8 + data_bytes + (data_bytes & 1)
+        return b"RIFF" + struct.pack("<I", riff_size) + b"WAVE" + fmt + b"data" + struct.pack("<I", data_bytes)
+
+    def _write_silence(self, seconds: float):
+        layout = self.layout
+        remaining = round(seconds * layout.sample_rate) * layout.block_align
+        while remaining > 0:
+            block = self._silence[:remaining]
+            self.file.write(block)
+            remaining -= len(block)
+            self.data_bytes += len(block)
+
+    def add(self, part_path: str, silence_before: float | None = None):
+        """Append one part's samples, preceded by silence unless it is the first part."""
+        with open(part_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            layout = read_layout(mapped)
+            if self.layout is None:
+                self._open(layout)
+            elif layout.format_key != self.layout.format_key:
+                raise ValueError(f"{part_path}: {layout.format_key} does not match "
+                                 f"{self.layout.format_key} (channels, rate, bits)")
+            if self.parts:
+                self._write_silence(self.silence_sec if silence_before is None else silence_before)
+            if self.data_bytes + layout.data_size > MAX_DATA_BYTES:
+                raise ValueError("stitched audio would exceed the 4 GiB WAV limit")
+            with memoryview(mapped) as view:
+                self.file.write(view[layout.data_offset:layout.data_offset + layout.data_size])
+            self.data_bytes += layout.data_size
+            self.parts += 1
+
+    def close(self, commit: bool = True):
+        if self.file is None:
+            if commit:
+                raise ValueError("no parts to stitch")
+            return
+        if commit:
+            if self.data_bytes & 1:
+                self.file.write(b"\x00")
+            self.file.seek(0)
+            self.file.write(self._header(self.data_bytes))
+        self.file.close()
+        self.file = None
+        if commit:
+            os.replace(self.tmp_path, self.path)
+        else:
+            os.remove(self.tmp_path)
+
+    @property
+    def seconds(self) -> float:
+        return self.layout.seconds(self.data_bytes) if self.layout else 0.0
+
+
+def stitch(parts: Iterable[str], out_path: str, silence_sec: float = DEFAULT_SILENCE) -> float:
+    """Join WAV parts in order; returns the stitched duration in seconds."""
+    with WavStitcher(out_path, silence_sec) as stitcher:
+        for part in parts:
+            stitcher.add(part)
+    return stitcher.seconds
+
+
+def group_chunks(chunks_csv: str) -> dict[str, list[dict]]:
+    """parent_id -> chunk rows in chunk_index order, from a ChunkWriter CSV."""
+    groups = defaultdict(list)
+    with open(chunks_csv, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            for field in FLOAT_FIELDS:
+                row[field] = float(row[field])
+            row["chunk_index"] = int(row["chunk_index"])
+            row["chunk_count"] = int(row["chunk_count"])
+            groups[row["parent_id"]].append(row)
+    for rows in groups.values():
+        rows.sort(key=lambda r: r["chunk_index"])
+    return groups
+
+
+def stitch_chunks(chunks_csv: str, cache_dir: str, out_dir: str, silence_sec: float) -> tuple[int, list[str], float]:
+    """Stitch every parent whose chunks are all cached; returns (stitched, incomplete ids, seconds)."""
+    os.makedirs(out_dir, exist_ok=True)
+    stitched, incomplete, seconds = 0, [], 0.0
+    for parent_id, rows in group_chunks(chunks_csv).items():
+        paths = [os.path.join(cache_dir, f"{row_key(row)}.wav") for row in rows]
+        if len(rows) != rows[0]["chunk_count"] or not all(os.path.exists(p) for p in paths):
+            incomplete.append(parent_id)
+            continue
+        seconds += stitch(paths, os.path.join(out_dir, f"{parent_id}.wav"), silence_sec)
+        stitched += 1
+    return stitched, incomplete, seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Join WAV parts with silence, streaming from memory-mapped inputs.")
+    parser.add_argument("output", nargs="?", help="Stitched WAV to write (with explicit parts)")
+    parser.add_argument("parts", nargs="*", help="WAV parts in order")
+    parser.add_argument("--silence", type=float, default=DEFAULT_SILENCE, help="Seconds of silence between parts")
+    parser.add_argument("--chunks", help="A <stem>.chunks.csv; stitch each parent text from its cached chunk audio")
+    parser.add_argument("--cache-dir", default=os.path.join(CACHE_DIR, "fake_audio"),
+                        help="AudioCache directory holding the chunk WAVs")
+    parser.add_argument("--out-dir", default=STITCHED_DIR, help="Where --chunks writes <parent_id>.wav")
+    args = parser.parse_args()
+
+    if args.chunks:
+        stitched, incomplete, seconds = stitch_chunks(args.chunks, args.cache_dir, args.out_dir, args.silence)
+        print(f"Stitched {stitched} texts ({seconds / 60:,.1f} min) into {args.out_dir}")
+        if incomplete:
+            print(f"{len(incomplete)} texts skipped, chunks not all synthesised: {', '.join(incomplete[:10])}"
+                  + (" ..." if len(incomplete) > 10 else ""))
+        return
+
+    if not args.output or not args.parts:
+        parser.error("give an output and at least one part, or --chunks")
+    try:
+        seconds = stitch(args.parts, args.output, args.silence)
+    except ValueError as e:
+        sys.exit(str(e))
+    print(f"Stitched {len(args.parts)} parts ({seconds:,.1f} s) into {args.output}")
+
+
+if __name__ == "__main__":
+    main()
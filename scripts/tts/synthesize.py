@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Parallel TTS synthesis driver for the rows written by generate_csv.py.
+Dispatches uncached rows to a pluggable backend through a bounded thread
+pool, with per-voice rate limits and retry with exponential backoff.
+Results land in the content-addressed AudioCache.
+
+Usage:
+    python scripts/tts/synthesize.py --backend fake --concurrency 8
+    python scripts/tts/synthesize.py --backend elevenlabs --concurrency 4 --voice-rps 2
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+import wave
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from audio_cache import AUDIO_CACHE_DIR, DEFAULT_MAX_BYTES, AudioCache
+from corpus import CACHE_DIR, PROJECT_ROOT, iter_csv_rows
+
+FAKE_AUDIO_DIR = os.path.join(CACHE_DIR, "fake_audio")
+
+# HTTP statuses worth retrying: rate limited or transient server errors
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RetryableError(Exception):
+    """A backend failure that may succeed if the request is retried."""
+
+
+class TTSBackend(ABC):
+    """Interface for synthesis backends: turn one CSV row into audio bytes."""
+
+    name = "base"
+    extension = "mp3"
+
+    @abstractmethod
+    def synthesize(self, row: dict) -> bytes:
+        """Audio bytes for one CSV row."""
+
+
+class FakeBackend(TTSBackend):
+    """Offline backend returning a silent WAV sized from estimated_duration_sec."""
+
+    name = "fake"
+    extension = "wav"
+
+    def __init__(self, sample_rate: int = 16000, latency: float = 0.0, failure_rate: float = 0.0):
+        self.sample_rate = sample_rate
+        self.latency = latency
+        self.failure_rate = failure_rate
+
+    def synthesize(self, row: dict) -> bytes:
+        if self.latency:
+            time.sleep(self.latency)
+        if self.failure_rate and random.random() < self.failure_rate:
+            raise RetryableError("simulated transient failure")
+        return silence_wav(float(row["estimated_duration_sec"]), self.sample_rate)
+
+
+class ElevenLabsBackend(TTSBackend):
+    """ElevenLabs text-to-speech, using the same model and settings as the TS scripts."""
+
+    name = "elevenlabs"
+    extension = "mp3"
+    url = "https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
+
+    def __init__(self, api_key: str, model_id: str = "eleven_multilingual_v2", timeout: float = 120.0):
+        self.api_key = api_key
+        self.model_id = model_id
+        self.timeout = timeout
+
+    def synthesize(self, row: dict) -> bytes:
+        body = json.dumps({
+            "text": row["text_romanian"],
+            "model_id": self.model_id,
+            "voice_settings": {
+                "stability": 0.5,
+                "similarity_boost": 0.75,
+                "speed": float(row["speed"]),
+            },
+        }).encode("utf-8")
+        request = urllib.request.Request(
+            self.url.format(voice_id=row["voice_id"]),
+            data=body,
+            headers={"xi-api-key": self.api_key, "Content-Type": "application/json"},
+            method="POST",
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read()
+        except urllib.error.HTTPError as e:
+            detail = e.read().decode("utf-8", "replace")[:200]
+            if e.code in RETRYABLE_STATUSES:
+                raise RetryableError(f"HTTP {e.code}: {detail}") from e
+            raise RuntimeError(f"HTTP {e.code}: {detail}") from e
+        except (urllib.error.URLError, TimeoutError) as e:
+            raise RetryableError(str(e)) from e
+
+
+def silence_wav(duration_sec: float, sample_rate: int = 16000) -> bytes:
+    """Return a 16-bit mono WAV of silence lasting duration_sec."""
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sample_rate)
+        w.writeframes(b"\x00\x00" * round(duration_sec * sample_rate))
+    return buf.getvalue()
+
+
+class RateLimiter:
+    """Spaces out request starts so one key never exceeds `rate` requests per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+@dataclass
+class SynthesisReport:
+    synthesized: int = 0
+    cached: int = 0
+    failed: list[str] = field(default_factory=list)
+    retries: int = 0
+    characters: int = 0
+    audio_sec: float = 0.0
+    wall_sec: float = 0.0
+
+    def summary(self) -> str:
+        rate = self.synthesized / self.wall_sec if self.wall_sec else 0.0
+        realtime = self.audio_sec / self.wall_sec if self.wall_sec else 0.0
+        return (f"Synthesised {self.synthesized} rows ({self.characters:,} chars, "
+                f"{self.audio_sec / 60:,.1f} min audio) in {self.wall_sec:.1f}s | "
+                f"{rate:.1f} rows/s, {realtime:.0f}x realtime | "
+                f"{self.cached} cached, {self.retries} retries, {len(self.failed)} failed")
+
+
+class SynthesisDriver:
+    """Runs uncached rows through a backend with bounded concurrency."""
+
+    def __init__(self, backend: TTSBackend, cache: AudioCache, concurrency: int = 4,
+                 voice_rps: float = 0.0, max_retries: int = 3, backoff: float = 1.0):
+        self.backend = backend
+        self.cache = cache
+        self.concurrency = concurrency
+        self.voice_rps = voice_rps
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._limiters: dict[str, RateLimiter] = {}
+        self._limiters_lock = threading.Lock()
+
+    def _limiter(self, voice_id: str) -> RateLimiter:
+        with self._limiters_lock:
+            if voice_id not in self._limiters:
+                self._limiters[voice_id] = RateLimiter(self.voice_rps)
+            return self._limiters[voice_id]
+
+    def _synthesize_one(self, row: dict) -> tuple[bytes, int]:
+        """Synthesise a row, retrying transient failures. Returns (audio, retries used)."""
+        limiter = self._limiter(row["voice_id"])
+        for attempt in range(self.max_retries):
+            limiter.wait()
+            try:
+                return self.backend.synthesize(row), attempt
+            except RetryableError:
+                # Exponential backoff with jitter so workers don't retry in lockstep
+                time.sleep(self.backoff * (2 ** attempt) * (0.5 + random.random()))
+        # Last attempt: a failure here propagates to the caller
+        limiter.wait()
+        return self.backend.synthesize(row), self.max_retries
+
+    def run(self, rows: list[dict]) -> SynthesisReport:
+        report = SynthesisReport()
+        cached, missing = self.cache.partition(rows)
+        report.cached = len(cached)
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            futures = {pool.submit(self._synthesize_one, row): row for row in missing}
+            for future in as_completed(futures):
+                row = futures[future]
+                try:
+                    audio, retries = future.result()
+                except Exception as e:
+                    report.failed.append(row["id"])
+                    print(f"  ❌ {row['id']}: {e}")
+                    continue
+                self.cache.put(row, audio)
+                report.synthesized += 1
+                report.retries += retries
+                report.characters += row["character_count"]
+                report.audio_sec += row["estimated_duration_sec"]
+        report.wall_sec = time.perf_counter() - start
+        return report
+
+
+def make_backend(args: argparse.Namespace) -> TTSBackend:
+    if args.backend == "fake":
+        return FakeBackend(latency=args.fake_latency, failure_rate=args.fake_failure_rate)
+    api_key = os.environ.get("ELEVENLABS_API_KEY")
+    if not api_key:
+        sys.exit("ELEVENLABS_API_KEY is not set")
+    return ElevenLabsBackend(api_key)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Synthesise uncached CSV rows in parallel.")
+    parser.add_argument("csv", nargs="?", default=os.path.join(PROJECT_ROOT, "romanian_month1_124k.csv"))
+    parser.add_argument("--backend", choices=["fake", "elevenlabs"], default="fake")
+    parser.add_argument("--concurrency", type=int, default=4, help="Maximum requests in flight")
+    parser.add_argument("--voice-rps", type=float, default=0.0, help="Per-voice requests/sec (0 = unlimited)")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--backoff", type=float, default=1.0, help="Base backoff in seconds")
+    parser.add_argument("--cache-dir", help="Defaults to .tts_cache/audio (.tts_cache/fake_audio for --backend fake)")
+    parser.add_argument("--max-mb", type=int, default=DEFAULT_MAX_BYTES // 1024 ** 2)
+    parser.add_argument("--limit", type=int, help="Only consider the first N rows")
+    parser.add_argument("--fake-latency", type=float, default=0.0, help="Simulated seconds per request")
+    parser.add_argument("--fake-failure-rate", type=float, default=0.0, help="Simulated retryable failure rate")
+    args = parser.parse_args()
+
+    backend = make_backend(args)
+    cache_dir = args.cache_dir or (FAKE_AUDIO_DIR if args.backend == "fake" else AUDIO_CACHE_DIR)
+    cache = AudioCache(cache_dir, args.max_mb * 1024 ** 2, backend.extension)
+
+    rows = list(iter_csv_rows(args.csv))
+    if args.limit:
+        rows = rows[:args.limit]
+
+    driver = SynthesisDriver(backend, cache, args.concurrency, args.voice_rps, args.retries, args.backoff)
+    report = driver.run(rows)
+    print(report.summary())
+    if report.failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
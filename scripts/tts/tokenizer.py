@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Romanian-aware word tokenizer for word_count.
+str.split() counts dialogue dashes ("- Bună ziua!") as words and keeps
+hyphenated clitic forms ("într-un", "mi-a", "dați-mi") as one word. This
+tokenizer matches words with precompiled regexes, so dashes and punctuation
+never count, and splits a hyphenated form into its words when one side is a
+clitic. Compounds ("Cluj-Napoca", "sud-est") and inflected loans
+("hobby-uri", "XIX-lea") stay one word. Cedilla (ş ţ) and comma-below
+(ș ț) spellings tokenize identically.
+
+Scanning runs inside the C regex engine and Python only inspects
+hyphenated tokens, which keeps word_count within a small constant factor of
+str.split().
+
+Usage:
+    python scripts/tts/tokenizer.py              # benchmark against str.split on the corpus
+    python scripts/tts/tokenizer.py --repeat 20
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Bump when word boundaries change, so manifests and indexes built on old counts are redone
+TOKENIZER_VERSION = 2
+
+# Runs of letters/digits joined by hyphens, or by separators between digits
+# ("10:30", "1.500" are one token). Every repetition must start with a
+# separator, so backtracking stays linear without possessive quantifiers
+# (those need Python 3.11).
+TOKEN_RE = re.compile(r"[^\W_]+(?:(?:-|(?<=\d)[.,:](?=\d))[^\W_]+)*")
+
+# Legacy cedilla letters folded to the correct comma-below forms
+CEDILLA_FOLD = str.maketrans("şţŞŢ", "șțȘȚ")
+
+# Short forms that attach to a neighbour with a hyphen but are words of their own
+CLITICS = {
+    # pronouns
+    "m", "mi", "mă", "ți", "te", "s", "se", "și", "l", "le", "i", "ne", "v", "vă", "o",
+    # auxiliaries and "a fi"
+    "am", "ai", "a", "ar", "aș", "au", "ați", "e",
+    # elided prepositions, articles and negation
+    "într", "printr", "dintr", "de", "să", "c", "n", "nu", "un", "una", "unul", "unei", "unui",
+}
+
+# Hyphenated endings that inflect the word before them rather than being words
+SUFFIXES = {"lea", "ul", "ului", "uri", "urile", "urilor", "ii", "ilor"}
+
+# Hyphenated forms written as a single lexical item despite starting with a clitic
+LEXICALIZED = {"într-adevăr"}
+
+# Loanword prefixes that look like a clitic ("e" = "este") but start one word:
+# "e-mail", "e-book", "e-mail-ul"
+LOAN_PREFIXES = {"e"}
+
+
+def split_clitics(token: str) -> list[str]:
+    """Split a hyphenated token at every hyphen that detaches a clitic."""
+    folded = token.translate(CEDILLA_FOLD).lower()
+    if folded in LEXICALIZED:
+        return [token]
+    pieces = token.split("-")
+    folded_pieces = folded.split("-")
+    words = [pieces[0]]
+    for i in range(1, len(pieces)):
+        left, right = folded_pieces[i - 1], folded_pieces[i]
+        if i == 1 and left in LOAN_PREFIXES:
+            words[-1] += "-" + pieces[i]
+        elif right not in SUFFIXES and (left in CLITICS or right in CLITICS):
+            words.append(pieces[i])
+        else:
+            words[-1] += "-" + pieces[i]
+    return words
+
+
+def tokenize(romanian: str) -> list[str]:
+    """Words of a text, in order, with clitics split off and original spelling kept."""
+    words = []
+    for token in TOKEN_RE.findall(romanian):
+        if "-" in token:
+            words.extend(split_clitics(token))
+        else:
+            words.append(token)
+    return words
+
+
+def token_spans(romanian: str) -> list[tuple[str, int]]:
+    """Like tokenize, paired with each word's character offset in the text."""
+    spans = []
+    for match in TOKEN_RE.finditer(romanian):
+        token, start = match.group(), match.start()
+        if "-" in token:
+            # split_clitics only cuts at hyphens, so each piece starts one past the previous
+            for word in split_clitics(token):
+                spans.append((word, start))
+                start += len(word) + 1
+        else:
+            spans.append((token, start))
+    return spans
+
+
+def normalize(word: str) -> str:
+    """Case- and cedilla-insensitive form of a word, for comparing tokens."""
+    return word.translate(CEDILLA_FOLD).lower()
+
+
+def word_count(romanian: str) -> int:
+    """Number of words in a text; equal to len(tokenize(romanian)) without building the list."""
+    tokens = TOKEN_RE.findall(romanian)
+    count = len(tokens)
+    if "-" in romanian:
+        for token in tokens:
+            if "-" in token:
+                count += len(split_clitics(token)) - 1
+    return count
+
+
+def benchmark(texts: list[str], repeat: int) -> dict:
+    """Time word_count against str.split over the texts and compare their totals."""
+    timings = {}
+    for name, count in (("str.split", lambda r: len(r.split())), ("tokenizer", word_count)):
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            total = sum(count(r) for r in texts)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = (best, total)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Romanian tokenizer against str.split.")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed passes per method (best is reported)")
+    parser.add_argument("--shard-dir", help="Also include *.jsonl shards in this directory")
+    args = parser.parse_args()
+
+    import snapshot
+    texts = [t["text_romanian"] for t in snapshot.iter_texts(shard_dir=args.shard_dir)]
+    timings = benchmark(texts, args.repeat)
+
+    split_time, split_total = timings["str.split"]
+    token_time, token_total = timings["tokenizer"]
+    print(f"{len(texts)} texts, best of {args.repeat}:")
+    print(f"  str.split  {split_time * 1000:8.2f} ms  {split_total:,} words")
+    print(f"  tokenizer  {token_time * 1000:8.2f} ms  {token_total:,} words "
+          f"({token_time / split_time:.1f}x the time, {token_total - split_total:+,} words)")
+
+    changed = sum(1 for r in texts if len(r.split()) != word_count(r))
+    print(f"  word_count differs for {changed} of {len(texts)} texts")
+
+
+if __name__ == "__main__":
+    main()
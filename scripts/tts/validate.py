@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Schema validation for the CEFR text corpus.
+Checks every text in one pass before anything is processed or synthesised:
+required keys and types, level and speaker_gender values, unique ids,
+level/id-prefix agreement and per-level length bounds. generate_csv.py runs
+it first and aborts on any problem, instead of defaulting a missing gender
+and finding out after the audio has been paid for.
+
+Usage:
+    python scripts/tts/validate.py [--shard-dir DIR]
+"""
+
+import argparse
+import os
+import re
+import sys
+from typing import Iterable, Iterator, NamedTuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import corpus
+import snapshot
+
+REQUIRED_KEYS = ["id", "level", "text_romanian", "topic", "speaker_gender"]
+
+LEVELS = frozenset(["A1", "A2", "B1", "B2", "C1"])
+GENDERS = frozenset(["male", "female"])
+
+ID_RE = re.compile(r"([A-C][12])_(\d{3,})")
+TOPIC_RE = re.compile(r"[a-z0-9]+(?:_[a-z0-9]+)*")
+
+# Characters of text_romanian allowed per level: the current corpus's range
+# with room either side, so a truncated or pasted-twice text stands out
+LENGTH_BOUNDS = {
+    "A1": (250, 600),
+    "A2": (300, 700),
+    "B1": (500, 1000),
+    "B2": (800, 1500),
+    "C1": (1200, 2200),
+}
+
+# Problems printed to the console before the rest are summarised
+PRINT_LIMIT = 50
+
+
+class Problem(NamedTuple):
+    position: int
+    text_id: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"  #{self.position} {self.text_id}: {self.message}"
+
+
+def source_texts(shard_dir: str | None = None, use_snapshot: bool = True) -> Iterator[dict]:
+    """Texts to validate: the snapshot when it is fresh, else the raw sources.
+
+    Building a snapshot assumes valid texts, so a stale one is never rebuilt here.
+    """
+    if use_snapshot and snapshot.is_fresh(snapshot.source_paths(shard_dir=shard_dir)):
+        return snapshot.iter_snapshot()
+    return corpus.iter_texts(shard_dir=shard_dir)
+
+
+def validate(texts: Iterable[dict]) -> list[Problem]:
+    """Return every schema problem in the corpus, in corpus order."""
+    problems = []
+    seen: dict[str, int] = {}
+
+    for position, text in enumerate(texts, 1):
+        text_id = text.get("id") if isinstance(text.get("id"), str) else "?"
+
+        def problem(message: str):
+            problems.append(Problem(position, text_id, message))
+
+        missing = [key for key in REQUIRED_KEYS if key not in text]
+        if missing:
+            problem(f"missing {', '.join(missing)}")
+        wrong_type = [key for key in REQUIRED_KEYS if key in text and not isinstance(text[key], str)]
+        if wrong_type:
+            problem(f"not a string: {', '.join(wrong_type)}")
+        if missing or wrong_type:
+            continue
+
+        level = text["level"]
+        if level not in LEVELS:
+            problem(f"unknown level '{level}'")
+        if text["speaker_gender"] not in GENDERS:
+            problem(f"unknown speaker_gender '{text['speaker_gender']}'")
+        if not TOPIC_RE.fullmatch(text["topic"]):
+            problem(f"topic '{text['topic']}' is not lower_snake_case")
+
+        match = ID_RE.fullmatch(text_id)
+        if not match:
+            problem("id does not look like LEVEL_NNN")
+        elif match.group(1) != level:
+            problem(f"id prefix {match.group(1)} does not match level {level}")
+
+        first = seen.setdefault(text_id, position)
+        if first != position:
+            problem(f"duplicate id (first seen at #{first})")
+
+        bounds = LENGTH_BOUNDS.get(level)
+        length = len(text["text_romanian"].strip())
+        if bounds and not bounds[0] <= length <= bounds[1]:
+            problem(f"{length} chars, outside {level} bounds {bounds[0]}-{bounds[1]}")
+
+    return problems
+
+
+def print_problems(problems: list[Problem]):
+    for problem in problems[:PRINT_LIMIT]:
+        print(problem)
+    if len(problems) > PRINT_LIMIT:
+        print(f"  ... and {len(problems) - PRINT_LIMIT} more")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate the corpus schema before generating the CSV.")
+    parser.add_argument("--shard-dir", help="Also validate *.jsonl shards in this directory")
+    args = parser.parse_args()
+
+    try:
+        problems = validate(source_texts(args.shard_dir))
+    except ValueError as e:  # a shard line that is not JSON
+        sys.exit(str(e))
+    if not problems:
+        print("Corpus is valid")
+        return
+    print(f"{len(problems)} schema problems:")
+    print_problems(problems)
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
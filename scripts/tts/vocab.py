@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Inverted vocabulary index over the corpus, for curriculum queries.
+Maps each normalized word (lowercase, comma-below diacritics, see
+tokenizer.normalize) to the texts it occurs in and its word positions
+there, so curators can ask which texts use a word or form without grepping
+the level modules. The index is saved in .tts_cache/vocab_index.json and
+updated incrementally: only texts whose content hash changed are
+re-tokenized, and removed texts are dropped from their postings.
+
+Queries are words (all must occur), quoted phrases (consecutive words) and
+prefixes ending in "*", with OR between alternatives:
+
+    mers                      texts containing "mers"
+    "am mers" OR "a mers"     either phrase
+    mare plajă                both words, anywhere in the text
+    merg*                     any word starting with "merg"
+
+Lookups are set intersections over in-memory postings, restricted up front
+to the requested levels and topics. Offsets refer to the normalized text
+(normalize.normalize_text), which is what the CSV holds by default.
+
+Usage:
+    python scripts/tts/vocab.py '"am mers" OR "a mers"' --level A2
+    python scripts/tts/vocab.py 'merg*' --level A1 --level A2 --topic travel
+    python scripts/tts/vocab.py --rebuild          # reindex everything, print index stats
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from bisect import bisect_left
+from typing import Iterable, NamedTuple
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from corpus import CACHE_DIR
+from manifest import text_hash
+from normalize import normalize_text
+from tokenizer import TOKENIZER_VERSION, normalize, token_spans, tokenize
+
+VOCAB_INDEX_PATH = os.path.join(CACHE_DIR, "vocab_index.json")
+
+# Bump when the index layout or normalization changes, so old indexes are rebuilt
+INDEX_VERSION = 1
+
+QUERY_TOKEN_RE = re.compile(r'"([^"]*)"|(\S+)')
+
+SNIPPET_CHARS = 40
+
+
+class Clause(NamedTuple):
+    terms: tuple[str, ...]  # one term, or a phrase
+    prefix: bool = False
+
+
+class Hit(NamedTuple):
+    id: str
+    level: str
+    topic: str
+    positions: list[int]  # word positions where a clause matched
+    offsets: list[int]  # character offsets of those words
+
+
+def query_terms(words: str) -> list[str]:
+    """Index terms for a piece of query text, normalized like the corpus."""
+    return [normalize(word) for word in tokenize(normalize_text(words)[0])]
+
+
+def parse_query(query: str) -> list[list[Clause]]:
+    """Alternatives separated by OR, each a list of clauses that must all match."""
+    groups: list[list[Clause]] = [[]]
+    for phrase, word in QUERY_TOKEN_RE.findall(query):
+        if word == "OR":
+            groups.append([])
+            continue
+        if word == "AND":
+            continue
+        if word.endswith("*") and len(word) > 1:
+            terms = query_terms(word[:-1])
+            if len(terms) != 1:
+                raise ValueError(f"prefix {word!r} must be a single word")
+            groups[-1].append(Clause(tuple(terms), prefix=True))
+            continue
+        terms = query_terms(phrase if phrase else word)
+        if terms:
+            # A hyphenated word ("într-un") tokenizes into a phrase of its own
+            groups[-1].append(Clause(tuple(terms)))
+    groups = [group for group in groups if group]
+    if not groups:
+        raise ValueError(f"no words in query {query!r}")
+    return groups
+
+
+class VocabIndex:
+    """Term -> {text id -> word positions}, with per-text level, topic and word offsets."""
+
+    def __init__(self, path: str = VOCAB_INDEX_PATH):
+        self.path = path
+        self.docs: dict[str, dict] = {}
+        self.postings: dict[str, dict[str, list[int]]] = {}
+        self.indexed = 0
+        self.removed = 0
+        self.dirty = False
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == INDEX_VERSION and data.get("tokenizer") == TOKENIZER_VERSION:
+                self.docs = data["docs"]
+                self.postings = data["postings"]
+        self._derive()
+
+    def _derive(self):
+        """Rebuild the lookup tables that are not saved: filters and the sorted vocabulary."""
+        self.by_level: dict[str, set[str]] = {}
+        self.by_topic: dict[str, set[str]] = {}
+        for text_id, doc in self.docs.items():
+            self.by_level.setdefault(doc["level"], set()).add(text_id)
+            self.by_topic.setdefault(doc["topic"], set()).add(text_id)
+        self.vocabulary = sorted(self.postings)
+
+    def update(self, texts: Iterable[dict]):
+        """Reindex texts that are new or changed and drop texts no longer present."""
+        seen = set()
+        stale: set[str] = set()
+        fresh: list[tuple[dict, str]] = []
+        for text in texts:
+            text_id = text["id"]
+            seen.add(text_id)
+            digest = text_hash(text)
+            doc = self.docs.get(text_id)
+            if doc and doc["hash"] == digest and doc["level"] == text["level"]:
+                continue
+            if doc:
+                stale.add(text_id)
+            fresh.append((text, digest))
+        gone = set(self.docs) - seen
+        stale |= gone
+
+        if stale:
+            # One pass over the vocabulary beats storing each text's term list
+            for term in list(self.postings):
+                posting = self.postings[term]
+                for text_id in stale.intersection(posting):
+                    del posting[text_id]
+                if not posting:
+                    del self.postings[term]
+            for text_id in gone:
+                del self.docs[text_id]
+
+        for text, digest in fresh:
+            self._add(text, digest)
+
+        self.indexed = len(fresh)
+        self.removed = len(gone)
+        if fresh or gone:
+            self.dirty = True
+            self._derive()
+
+    def _add(self, text: dict, digest: str):
+        text_id = text["id"]
+        spans = token_spans(normalize_text(text["text_romanian"])[0])
+        for position, (word, _) in enumerate(spans):
+            self.postings.setdefault(normalize(word), {}).setdefault(text_id, []).append(position)
+        self.docs[text_id] = {
+            "hash": digest,
+            "level": text["level"],
+            "topic": text.get("topic", ""),
+            "starts": [start for _, start in spans],
+        }
+
+    def save(self):
+        if not self.dirty:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "tokenizer": TOKENIZER_VERSION,
+                       "docs": self.docs, "postings": self.postings},
+                      f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def candidates(self, levels: Iterable[str] | None = None, topics: Iterable[str] | None = None) -> set[str] | None:
+        """Ids allowed by the filters, or None when unfiltered."""
+        allowed = None
+        if levels:
+            allowed = set().union(*(self.by_level.get(level, ()) for level in levels))
+        if topics:
+            by_topic = set().union(*(self.by_topic.get(topic, ()) for topic in topics))
+            allowed = by_topic if allowed is None else allowed & by_topic
+        return allowed
+
+    def _prefix_postings(self, prefix: str) -> dict[str, list[int]]:
+        merged: dict[str, list[int]] = {}
+        i = bisect_left(self.vocabulary, prefix)
+        while i < len(self.vocabulary) and self.vocabulary[i].startswith(prefix):
+            for text_id, positions in self.postings[self.vocabulary[i]].items():
+                merged.setdefault(text_id, []).extend(positions)
+            i += 1
+        return merged
+
+    def _match(self, clause: Clause, allowed: set[str] | None) -> dict[str, list[int]]:
+        """text id -> positions where the clause starts, within ``allowed``."""
+        if clause.prefix:
+            postings = [self._prefix_postings(clause.terms[0])]
+        else:
+            postings = [self.postings.get(term, {}) for term in clause.terms]
+        ids = min(postings, key=len).keys()
+        if allowed is not None:
+            ids = allowed.intersection(ids)
+        if len(postings) == 1:
+            return {text_id: postings[0][text_id] for text_id in ids if text_id in postings[0]}
+
+        matches = {}
+        for text_id in ids:
+            if not all(text_id in posting for posting in postings):
+                continue
+            following = [set(posting[text_id]) for posting in postings[1:]]
+            starts = [p for p in postings[0][text_id]
+                      if all(p + k in positions for k, positions in enumerate(following, 1))]
+            if starts:
+                matches[text_id] = starts
+        return matches
+
+    def search(self, query: str, levels: Iterable[str] | None = None,
+               topics: Iterable[str] | None = None) -> list[Hit]:
+        """Texts matching the query, in id order."""
+        allowed = self.candidates(levels, topics)
+        found: dict[str, set[int]] = {}
+        for group in parse_query(query):
+            # Narrow the candidates clause by clause, so later clauses only check survivors
+            group_allowed, positions = allowed, {}
+            for clause in group:
+                matches = self._match(clause, group_allowed)
+                group_allowed = set(matches)
+                for text_id in group_allowed:
+                    positions.setdefault(text_id, set()).update(matches[text_id])
+                if not group_allowed:
+                    break
+            for text_id in group_allowed:
+                found.setdefault(text_id, set()).update(positions[text_id])
+
+        hits = []
+        for text_id in sorted(found):
+            doc = self.docs[text_id]
+            positions = sorted(found[text_id])
+            hits.append(Hit(text_id, doc["level"], doc["topic"], positions,
+                            [doc["starts"][p] for p in positions]))
+        return hits
+
+    def summary(self) -> str:
+        return (f"Vocabulary index: {len(self.docs)} texts, {len(self.postings):,} distinct words; "
+                f"{self.indexed} texts indexed, {self.removed} removed")
+
+
+def snippet(romanian: str, offset: int) -> str:
+    start = max(0, offset - SNIPPET_CHARS)
+    end = min(len(romanian), offset + SNIPPET_CHARS)
+    text = romanian[start:end].replace("\n", " ")
+    return ("…" if start else "") + text + ("…" if end < len(romanian) else "")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the inverted vocabulary index of the corpus.")
+    parser.add_argument("query", nargs="?", help='Words, "quoted phrases" and prefix* terms; OR between alternatives')
+    parser.add_argument("--level", action="append", help="Only texts of this level (repeatable)")
+    parser.add_argument("--topic", action="append", help="Only texts of this topic (repeatable)")
+    parser.add_argument("--limit", type=int, default=20, help="Texts to print (all are counted)")
+    parser.add_argument("--shard-dir", help="Also index *.jsonl shards in this directory")
+    parser.add_argument("--index", default=VOCAB_INDEX_PATH, help="Index file path")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the saved index and reindex every text")
+    args = parser.parse_args()
+
+    import snapshot
+    if args.rebuild and os.path.exists(args.index):
+        os.remove(args.index)
+    texts = {t["id"]: t for t in snapshot.iter_texts(shard_dir=args.shard_dir)}
+
+    start = time.perf_counter()
+    index = VocabIndex(args.index)
+    index.update(texts.values())
+    index.save()
+    print(f"{index.summary()} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+    if not args.query:
+        return
+
+    start = time.perf_counter()
+    try:
+        hits = index.search(args.query, args.level, args.topic)
+    except ValueError as e:
+        sys.exit(str(e))
+    elapsed = (time.perf_counter() - start) * 1_000_000
+
+    occurrences = sum(len(hit.positions) for hit in hits)
+    print(f"{len(hits)} texts, {occurrences} matches ({elapsed:,.0f} µs)")
+    for hit in hits[:args.limit]:
+        romanian = normalize_text(texts[hit.id]["text_romanian"])[0]
+        print(f"  {hit.id:<8} {hit.level:<3} {hit.topic:<20} {len(hit.positions):>3}x  "
+              f"{snippet(romanian, hit.offsets[0])}")
+    if len(hits) > args.limit:
+        print(f"  ... {len(hits) - args.limit} more")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Voice tables and voice schedulers for the TTS corpus.
+RoundRobinScheduler reproduces the original cycling assignment. Because
+there are fewer male voices than female ones, and long C1 texts can land on
+one voice, it leaves some voices with far more audio than others.
+BalancedScheduler instead gives each text to the least-loaded voice of the
+right gender, optionally under per-voice capacity limits, which shortens
+the synthesis makespan. Given a planning pass over the corpus it uses
+longest-processing-time-first order; otherwise it schedules online.
+"""
+
+import heapq
+from collections import Counter
+from typing import Callable, Iterable
+
+# Voice IDs
+MALE_VOICES = [
+    "b4bnZ9y3ZRH0myLzE2B5",
+    "8nBBDfYxYXmDNaqTCxPH",
+    "HPdbgrGubKiBta6Pq21b",
+]
+
+FEMALE_VOICES = [
+    "PoHUWWWMHFrA8z7Q88pu",
+    "QtObtrglHRaER8xlDZsr",
+    "gbLy9ep70G3JW53cTzFC",
+    "gCte8DU5EgI3W1KcuLSA",
+    "kZXTQfulCLOSFsxuZQHx",
+    "GRHbHyXbUO8nF4YexVTa",
+]
+
+VOICES_BY_GENDER = {"male": MALE_VOICES, "female": FEMALE_VOICES}
+
+
+class VoiceCapacityError(Exception):
+    """Every voice of the requested gender is at its capacity limit."""
+
+
+def assign_voice(gender: str, index: int) -> str:
+    """Assign a voice ID based on gender, cycling through available voices."""
+    if gender == "male":
+        return MALE_VOICES[index % len(MALE_VOICES)]
+    else:
+        return FEMALE_VOICES[index % len(FEMALE_VOICES)]
+
+
+def text_load(text: dict) -> int:
+    """Scheduling weight of a text: its character count (billing and duration both scale with it)."""
+    return len(text["text_romanian"])
+
+
+class RoundRobinScheduler:
+    """Original assignment: cycle through each gender's voices by text index."""
+
+    name = "round-robin"
+
+    def __init__(self):
+        self.indices = Counter()
+        self.loads = Counter()
+
+    def assign(self, text: dict) -> str:
+        gender = text["speaker_gender"]
+        voice = assign_voice(gender, self.indices[gender])
+        self.record(text, voice)
+        return voice
+
+    def record(self, text: dict, voice: str):
+        """Account for a text whose voice was decided elsewhere (e.g. a reused row)."""
+        self.indices[text["speaker_gender"]] += 1
+        self.loads[voice] += text_load(text)
+
+    def makespan(self) -> int:
+        return max(self.loads.values(), default=0)
+
+
+class BalancedScheduler:
+    """Assign each text to the least-loaded voice of its gender that has capacity left."""
+
+    name = "balanced"
+
+    def __init__(self, capacities: dict[str, int] | None = None):
+        self.capacities = capacities or {}
+        self.loads = Counter()
+        self.heaps = self._empty_heaps()
+        # id -> voice from plan(); texts not in the plan are scheduled online
+        self.planned: dict[str, str] = {}
+        # Ids of reused rows plan() already charged, so record() does not charge them twice
+        self.precharged: set[str] = set()
+        # Shadow round-robin run, so the report can compare makespans
+        self.baseline = RoundRobinScheduler()
+
+    @staticmethod
+    def _empty_heaps() -> dict[str, list]:
+        """gender -> heap of (load, tie-break position, voice)"""
+        return {
+            gender: [(0, i, voice) for i, voice in enumerate(voices)]
+            for gender, voices in VOICES_BY_GENDER.items()
+        }
+
+    def _pick(self, heaps: dict[str, list], loads: Counter, text_id: str, gender: str, load: int) -> str:
+        """Pop the least-loaded voice with room, charge it the load and push it back."""
+        heap = heaps[gender]
+        full = []
+        while heap and not self._has_room(loads, heap[0][2], load):
+            full.append(heapq.heappop(heap))
+        if not heap:
+            for entry in full:
+                heapq.heappush(heap, entry)
+            raise VoiceCapacityError(f"No {gender} voice has room for {text_id} ({load:,} chars)")
+
+        _, position, voice = heapq.heappop(heap)
+        loads[voice] += load
+        heapq.heappush(heap, (loads[voice], position, voice))
+        for entry in full:
+            heapq.heappush(heap, entry)
+        return voice
+
+    def _has_room(self, loads: Counter, voice: str, load: int) -> bool:
+        capacity = self.capacities.get(voice)
+        return capacity is None or loads[voice] + load <= capacity
+
+    def plan(self, texts: Iterable[dict], fixed: Callable[[dict], str | None] | None = None):
+        """Pre-assign voices longest text first (LPT), from a lightweight pass over the corpus.
+
+        ``fixed`` returns the voice a text must keep (a reused row), or None. Those
+        loads are charged up front, to the plan and to the live loads, so capacity
+        limits hold for the texts scheduled around them whatever the stream order.
+        """
+        heaps, loads = self._empty_heaps(), Counter()
+        self.planned, self.precharged = {}, set()
+        jobs = []
+        for text in texts:
+            text_id, gender, load = text["id"], text.get("speaker_gender", "female"), text_load(text)
+            voice = fixed(text) if fixed else None
+            if voice is None:
+                jobs.append((load, text_id, gender))
+                continue
+            self.planned[text_id] = voice
+            self.precharged.add(text_id)
+            self._charge(heaps, loads, gender, voice, load)
+            self._charge(self.heaps, self.loads, gender, voice, load)
+        over = [voice for voice, capacity in self.capacities.items() if loads[voice] > capacity]
+        if over:
+            raise VoiceCapacityError(f"Reused rows already exceed the capacity of {', '.join(over)}")
+
+        jobs.sort(key=lambda job: (-job[0], job[1]))
+        for load, text_id, gender in jobs:
+            self.planned[text_id] = self._pick(heaps, loads, text_id, gender, load)
+
+    def assign(self, text: dict) -> str:
+        load = text_load(text)
+        voice = self.planned.get(text["id"])
+        # A plan made before the text's gender was edited is no use
+        if voice not in VOICES_BY_GENDER[text["speaker_gender"]] or not self._has_room(self.loads, voice, load):
+            voice = self._pick(self.heaps, self.loads, text["id"], text["speaker_gender"], load)
+        else:
+            self._charge(self.heaps, self.loads, text["speaker_gender"], voice, load)
+        self.baseline.assign(text)
+        return voice
+
+    @staticmethod
+    def _charge(heaps: dict[str, list], loads: Counter, gender: str, voice: str, load: int):
+        """Add load to a voice chosen outside _pick, keeping its heap entry current."""
+        loads[voice] += load
+        heap = heaps[gender]
+        for i, (_, position, v) in enumerate(heap):
+            if v == voice:
+                heap[i] = (loads[voice], position, voice)
+                heapq.heapify(heap)
+                break
+
+    def forget(self, text_id: str):
+        """Drop a text's planned voice, so its next assign() schedules it afresh."""
+        self.planned.pop(text_id, None)
+        self.precharged.discard(text_id)
+
+    def record(self, text: dict, voice: str):
+        """Account for a text whose voice was decided elsewhere (e.g. a reused row)."""
+        if text["id"] in self.precharged:
+            self.precharged.discard(text["id"])
+        else:
+            self._charge(self.heaps, self.loads, text["speaker_gender"], voice, text_load(text))
+        self.baseline.assign(text)
+
+    def makespan(self) -> int:
+        return max(self.loads.values(), default=0)
+
+    def report(self) -> str:
+        balanced, baseline = self.makespan(), self.baseline.makespan()
+        saved = (1 - balanced / baseline) * 100 if baseline else 0.0
+        change = f"{saved:.1f}% shorter" if saved >= 0 else f"{-saved:.1f}% longer"
+        lines = [f"Voice makespan: {balanced:,} chars balanced vs {baseline:,} round-robin ({change})"]
+        for gender, voices in VOICES_BY_GENDER.items():
+            loads = " ".join(f"{self.loads[v]:,}" for v in voices)
+            lines.append(f"  {gender}: {loads}")
+        return "\n".join(lines)
+
+
+def parse_capacities(spec: str | None) -> dict[str, int]:
+    """Parse "voiceA=20000,voiceB=15000" into per-voice character limits."""
+    capacities = {}
+    if not spec:
+        return capacities
+    for part in spec.split(","):
+        voice, _, value = part.partition("=")
+        voice = voice.strip()
+        if not value:
+            raise ValueError(f"Invalid capacity '{part}', expected VOICE_ID=CHARS")
+        if not any(voice in voices for voices in VOICES_BY_GENDER.values()):
+            raise ValueError(f"Unknown voice '{voice}' in capacity '{part}'")
+        try:
+            capacity = int(value)
+        except ValueError:
+            raise ValueError(f"Invalid capacity '{part}', expected VOICE_ID=CHARS") from None
+        if capacity <= 0:
+            raise ValueError(f"Capacity must be a positive number of characters in '{part}'")
+        capacities[voice] = capacity
+    return capacities
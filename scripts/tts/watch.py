@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Watch mode for generate_csv.py: keep the CSV current while curating texts.
+Polls the level modules' mtimes and sizes. When one changes, only that
+module is re-read (compiled from source, bypassing the import and bytecode
+caches), its texts are diffed by id and content hash, and only changed or
+added rows are recomputed. The CSV and manifest are then rewritten from the
+in-memory rows, so a one-text edit takes milliseconds and the next normal
+run still sees an up-to-date manifest. Edited texts keep their voice unless
+their speaker_gender changed.
+
+Other outputs (columnar, shards, chunks, metrics, ledger) are left to a
+normal run.
+"""
+
+import os
+import time
+from typing import Callable
+
+from corpus import LEVEL_MODULES, SCRIPT_DIR, iter_csv_rows
+from manifest import load_manifest, manifest_path_for, text_hash, write_manifest
+from normalize import normalize_text
+from outputs import FIELDNAMES, CsvOutput
+from stats import StatsTable
+from validate import print_problems, validate
+from voices import VoiceCapacityError
+
+DEFAULT_INTERVAL = 0.5  # seconds between polls
+
+
+def module_path(name: str) -> str:
+    return os.path.join(SCRIPT_DIR, f"{name}.py")
+
+
+def file_signature(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def load_module_texts(name: str) -> list[dict]:
+    """Execute a level module's current source and return its texts."""
+    path = module_path(name)
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    namespace = {"__name__": name, "__file__": path}
+    exec(compile(source, path, "exec"), namespace)
+    return namespace["texts"]
+
+
+class Watcher:
+    """In-memory rows of one generated CSV, updated one module at a time."""
+
+    def __init__(self, csv_path: str, settings: str,
+                 process_text: Callable[[dict, str | None], dict],
+                 normalize: bool = True, check_schema: bool = True,
+                 modules: list[str] = LEVEL_MODULES, interval: float = DEFAULT_INTERVAL):
+        self.csv_path = csv_path
+        self.settings = settings
+        self.process_text = process_text
+        self.normalize = normalize
+        self.check_schema = check_schema
+        self.modules = modules
+        self.interval = interval
+
+        self.rows = {row["id"]: row for row in iter_csv_rows(csv_path)}
+        self.hashes: dict[str, str] = {}
+        self.module_ids: dict[str, list[str]] = {}
+        self.signatures = {name: file_signature(module_path(name)) for name in modules}
+        for name in modules:
+            texts = self._prepare(load_module_texts(name))
+            self.module_ids[name] = [t["id"] for t in texts]
+            self.hashes.update((t["id"], text_hash(t)) for t in texts)
+        # Rows that came from elsewhere (e.g. JSONL shards) are kept as they are, after the modules,
+        # with their hashes carried over so the rewritten manifest still lists them
+        module_owned = {text_id for ids in self.module_ids.values() for text_id in ids}
+        self.extra_ids = [text_id for text_id in self.rows if text_id not in module_owned]
+        previous = load_manifest(manifest_path_for(csv_path), settings)
+        self.hashes.update((text_id, previous[text_id]) for text_id in self.extra_ids if text_id in previous)
+
+    def _prepare(self, texts: list[dict]) -> list[dict]:
+        texts = [dict(t) for t in texts]
+        if self.normalize:
+            for text in texts:
+                text["text_romanian"] = normalize_text(text["text_romanian"])[0]
+        return texts
+
+    def ordered_rows(self):
+        for name in self.modules:
+            for text_id in self.module_ids[name]:
+                yield self.rows[text_id]
+        for text_id in self.extra_ids:
+            yield self.rows[text_id]
+
+    def update(self, name: str) -> str | None:
+        """Re-read one module and recompute its changed rows; returns a one-line report."""
+        start = time.perf_counter()
+        try:
+            texts = self._prepare(load_module_texts(name))
+        except Exception as e:  # a half-saved file is normal while editing
+            return f"{name}: not loaded ({type(e).__name__}: {e}); waiting for the next save"
+
+        if self.check_schema:
+            problems = validate(texts)
+            other_ids = {text_id for other, ids in self.module_ids.items() if other != name for text_id in ids}
+            clashes = [t["id"] for t in texts if t.get("id") in other_ids]
+            if problems or clashes:
+                print(f"{name}: {len(problems) + len(clashes)} schema problems, CSV left as it was:")
+                print_problems(problems)
+                for text_id in clashes:
+                    print(f"  {text_id}: id already used by another module")
+                return None
+
+        old_ids = set(self.module_ids[name])
+        new_ids = [t["id"] for t in texts]
+        changed, added = [], []
+        processed: dict[str, tuple[dict, str]] = {}
+        try:
+            for text in texts:
+                text_id = text["id"]
+                digest = text_hash(text)
+                if self.hashes.get(text_id) == digest and text_id in self.rows:
+                    continue
+                previous = self.rows.get(text_id)
+                keep_voice = None
+                if previous and previous["speaker_gender"] == text.get("speaker_gender", "female"):
+                    keep_voice = previous["voice_id"]
+                processed[text_id] = (self.process_text(text, keep_voice), digest)
+                (changed if text_id in old_ids else added).append(text_id)
+        except VoiceCapacityError as e:
+            return f"{name}: {e}; CSV left as it was"
+        for text_id, (row, digest) in processed.items():
+            self.rows[text_id] = row
+            self.hashes[text_id] = digest
+
+        removed = sorted(old_ids.difference(new_ids))
+        for text_id in removed:
+            self.rows.pop(text_id, None)
+            self.hashes.pop(text_id, None)
+        self.module_ids[name] = new_ids
+
+        if not (changed or added or removed):
+            return f"{name}: saved, no text changed"
+
+        stats = self.write(changed, added, removed)
+        elapsed = (time.perf_counter() - start) * 1000
+        totals = stats.aggregate()
+        ids = ", ".join((changed + added + removed)[:5])
+        return (f"{name}: {len(changed)} changed, {len(added)} added, {len(removed)} removed ({ids}) "
+                f"-> {len(stats)} texts, {totals['character_count']['sum']:,} chars, "
+                f"{totals['estimated_duration_sec']['sum'] / 60:,.1f} min; updated in {elapsed:.1f} ms")
+
+    def write(self, changed: list[str], added: list[str], removed: list[str]) -> StatsTable:
+        """Rewrite the CSV and manifest from memory, returning fresh stats."""
+        stats = StatsTable()
+        with CsvOutput(self.csv_path, FIELDNAMES) as output:
+            for row in self.ordered_rows():
+                output.write(row)
+                stats.append(row)
+        current = {text_id: self.hashes[text_id] for text_id in self.module_order_ids() if text_id in self.hashes}
+        write_manifest(self.csv_path, self.settings, current, changed, added, removed)
+        return stats
+
+    def module_order_ids(self) -> list[str]:
+        return [text_id for name in self.modules for text_id in self.module_ids[name]] + self.extra_ids
+
+    def poll(self) -> list[str]:
+        """Names of modules whose file changed since the last poll."""
+        changed = []
+        for name in self.modules:
+            signature = file_signature(module_path(name))
+            if signature is not None and signature != self.signatures[name]:
+                self.signatures[name] = signature
+                changed.append(name)
+        return changed
+
+    def run(self):
+        print(f"Watching {', '.join(f'{m}.py' for m in self.modules)} every {self.interval}s (Ctrl+C to stop)")
+        try:
+            while True:
+                for name in self.poll():
+                    report = self.update(name)
+                    if report:
+                        print(report)
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            print("\nStopped watching")